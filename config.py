@@ -4,16 +4,202 @@ Configuração e gerenciamento de stop words para o Analisador Documental.
 
 import json
 import os
-from typing import Set, Dict, List
+import re
+import threading
+from functools import lru_cache
+from typing import FrozenSet, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
 
+# Parser JSON em C, usado quando disponível
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Detector de idioma em C++ (pycld3), usado quando disponível; sem ele, ou
+# quando a previsão não é confiável, valem as palavras características
+try:
+    import cld3
+except ImportError:
+    cld3 = None
+
 logger = logging.getLogger(__name__)
 
+# Stop words padrão usadas quando o arquivo de configuração não existe
+_DEFAULT_STOP_WORDS: Dict[str, List[str]] = {
+    "portugues": [
+        "a", "o", "e", "é", "de", "do", "da", "em", "um", "para", "com", "não", "uma",
+        "os", "no", "se", "na", "por", "mais", "as", "dos", "como", "mas", "foi", "ele", "das"
+    ],
+    "ingles": [
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "he", "in", "is", "it", "its", "of", "on", "that", "the", "to", "was", "will", "with",
+        "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your", "yours", "yourself", "yourselves"
+    ]
+}
+
+# Configuração padrão já serializada, gravada diretamente em bytes
+_DEFAULT_CONFIG_BYTES = json.dumps(_DEFAULT_STOP_WORDS, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Palavras características de cada idioma, usadas na detecção automática
+_INDICADORES: Dict[str, FrozenSet[str]] = {
+    idioma: frozenset(palavras) for idioma, palavras in {
+        "portugues": ["de", "da", "do", "em", "um", "uma", "para", "com", "não", "que", "se", "por", "mais", "as", "dos", "como", "mas", "foi", "ele", "das"],
+        "ingles": ["the", "and", "of", "to", "a", "in", "is", "it", "you", "that", "he", "was", "for", "on", "are", "as", "with", "his", "they", "at"],
+        "espanhol": ["de", "la", "el", "en", "y", "a", "los", "se", "del", "las", "un", "por", "con", "no", "una", "su", "para", "es", "al", "lo"]
+    }.items()
+}
+
+# Ordem dos idiomas nas máscaras de bits (bit 0 = portugues, bit 1 = ingles, ...)
+_IDIOMAS_INDICADORES = tuple(_INDICADORES)
+
+# Máscara de bits por palavra característica, indicando a quais idiomas ela pertence
+_MASCARAS_PALAVRAS: Dict[str, int] = {}
+for _bit, _idioma in enumerate(_IDIOMAS_INDICADORES):
+    for _palavra in _INDICADORES[_idioma]:
+        _MASCARAS_PALAVRAS[_palavra] = _MASCARAS_PALAVRAS.get(_palavra, 0) | (1 << _bit)
+del _bit, _idioma, _palavra
+
+# Conjunto vazio compartilhado, devolvido para idiomas sem stop words
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Conteúdo já lido de cada arquivo de configuração: caminho -> (st_mtime_ns, dados)
+_stat_cache: Dict[str, Tuple[int, Dict[str, List[str]]]] = {}
+
+# Tokenizador de palavras (apenas letras, incluindo acentuadas)
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+# Parâmetros da parada antecipada da detecção de idioma: a cada
+# _DETECCAO_INTERVALO palavras (após _DETECCAO_MIN_TOKENS), encerra se o
+# idioma líder tiver mais de _DETECCAO_MARGEM ocorrências de vantagem
+_DETECCAO_MIN_TOKENS = 500
+_DETECCAO_INTERVALO = 256
+_DETECCAO_MARGEM = 20
+
+# Códigos ISO do cld3 para os idiomas suportados e tamanho máximo do texto
+# analisado por ele (a precisão satura bem antes disso)
+_IDIOMAS_CLD3 = {'pt': 'portugues', 'en': 'ingles', 'es': 'espanhol'}
+_CLD3_MAX_CHARS = 20000
+
+# Textos de até este tamanho têm o idioma detectado memorizado (textos maiores
+# ficariam presos no cache)
+_DETECCAO_CACHE_MAX_CHARS = 16 * 1024
+
+def _tokenizar_para_deteccao(texto: str) -> Iterator[str]:
+    """
+    Gera as palavras do texto em minúsculas, sob demanda: com a parada
+    antecipada da detecção, o restante do texto nem chega a ser tokenizado.
+
+    Args:
+        texto (str): Texto para análise
+
+    Yields:
+        str: Palavras em minúsculas
+    """
+    return (match.group().lower() for match in _WORD_RE.finditer(texto))
+
+def _detectar_idioma_tokens(tokens: Iterable[str]) -> str:
+    """
+    Detecta o idioma de uma sequência de palavras em minúsculas pelas palavras
+    características de cada idioma.
+    
+    Args:
+        tokens (Iterable[str]): Palavras do texto
+        
+    Returns:
+        str: Idioma detectado ('portugues', 'ingles', 'espanhol')
+    """
+    # Percorre as palavras como um fluxo, sem copiar o texto inteiro,
+    # com uma única consulta ao dicionário de máscaras por palavra
+    mascaras = _MASCARAS_PALAVRAS
+    contagens = [0] * len(_IDIOMAS_INDICADORES)
+    for lidos, palavra in enumerate(tokens, 1):
+        mascara = mascaras.get(palavra, 0)
+        if mascara:
+            for bit in range(len(contagens)):
+                contagens[bit] += (mascara >> bit) & 1
+        
+        # Encerra assim que um idioma tiver vantagem clara
+        if lidos % _DETECCAO_INTERVALO == 0 and lidos >= _DETECCAO_MIN_TOKENS:
+            segundo, primeiro = sorted(contagens)[-2:]
+            if primeiro - segundo > _DETECCAO_MARGEM:
+                break
+    
+    # Retorna o idioma com mais palavras características
+    if any(contagens):
+        return _IDIOMAS_INDICADORES[contagens.index(max(contagens))]
+    
+    return "portugues"  # Padrão
+
+def _detectar_idioma_cld3(texto: str) -> Optional[str]:
+    """
+    Detecta o idioma com o cld3, se instalado, analisando no máximo
+    _CLD3_MAX_CHARS caracteres.
+    
+    Args:
+        texto (str): Texto para análise
+        
+    Returns:
+        Optional[str]: Idioma detectado ou None se o cld3 não estiver disponível,
+            a previsão não for confiável ou o idioma não for suportado
+    """
+    if cld3 is None or not texto:
+        return None
+    previsao = cld3.get_language(texto[:_CLD3_MAX_CHARS])
+    if previsao is None or not previsao.is_reliable:
+        return None
+    return _IDIOMAS_CLD3.get(previsao.language)
+
+@lru_cache(maxsize=256)
+def _detectar_idioma_texto(texto: str) -> str:
+    """
+    Detecta o idioma de um texto, usando o cld3 quando disponível. A versão
+    decorada memoriza o resultado (apenas para textos curtos); textos longos
+    usam _detectar_idioma_texto.__wrapped__.
+    
+    Args:
+        texto (str): Texto para análise
+        
+    Returns:
+        str: Idioma detectado
+    """
+    return _detectar_idioma_cld3(texto) or _detectar_idioma_tokens(_tokenizar_para_deteccao(texto))
+
+def _ler_config(caminho: str) -> Dict[str, List[str]]:
+    """
+    Lê o arquivo de configuração de stop words.
+
+    Um único stat substitui exists + open e permite reaproveitar o conteúdo
+    já lido enquanto o arquivo não for modificado.
+
+    Args:
+        caminho (str): Caminho para o arquivo de configuração JSON
+
+    Returns:
+        Dict[str, List[str]]: Listas de stop words por idioma
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+    """
+    mtime = os.stat(caminho).st_mtime_ns
+    chave = os.path.abspath(caminho)
+    cache = _stat_cache.get(chave)
+    if cache and cache[0] == mtime:
+        return cache[1]
+
+    with open(caminho, 'rb') as file:
+        conteudo = file.read()
+    data = orjson.loads(conteudo) if orjson else json.loads(conteudo)
+    _stat_cache[chave] = (mtime, data)
+    return data
+
 class StopWordsManager:
     """
     Gerenciador de stop words para diferentes idiomas.
     """
     
+    # Instâncias compartilhadas por arquivo de configuração (ver get())
+    _instances: Dict[str, "StopWordsManager"] = {}
+    
     def __init__(self, config_file: str = "stop_words.json"):
         """
         Inicializa o gerenciador de stop words.
@@ -22,65 +208,118 @@ class StopWordsManager:
             config_file (str): Caminho para o arquivo de configuração JSON
         """
         self.config_file = config_file
-        self.stop_words_cache: Dict[str, Set[str]] = {}
+        self.stop_words_cache: Dict[str, FrozenSet[str]] = {}
+        # Dados do arquivo a partir dos quais o cache foi montado (ver get())
+        self._dados_config: Optional[Dict[str, List[str]]] = None
+        self._gravacao_padrao: Optional[threading.Thread] = None
         self._load_stop_words()
     
+    @classmethod
+    def get(cls, config_file: str = "stop_words.json") -> "StopWordsManager":
+        """
+        Retorna uma instância compartilhada para o arquivo de configuração,
+        criando-a apenas na primeira chamada. Se o arquivo foi modificado desde
+        a carga, as stop words da instância são recarregadas.
+        
+        Args:
+            config_file (str): Caminho para o arquivo de configuração JSON
+            
+        Returns:
+            StopWordsManager: Gerenciador associado ao arquivo
+        """
+        chave = os.path.abspath(config_file)
+        instancia = cls._instances.get(chave)
+        if instancia is None:
+            instancia = cls._instances[chave] = cls(config_file)
+        else:
+            instancia._recarregar_se_modificado()
+        return instancia
+    
+    def _recarregar_se_modificado(self) -> None:
+        """
+        Recarrega as stop words se o arquivo de configuração mudou. _ler_config
+        só relê o arquivo quando o mtime muda; caso contrário devolve os mesmos
+        dados e nada é refeito.
+        """
+        try:
+            data = _ler_config(self.config_file)
+        except Exception:
+            # Arquivo removido ou inválido: mantém as stop words já carregadas
+            return
+        if data is self._dados_config:
+            return
+        if data == self._dados_config:
+            # Mesmo conteúdo já carregado (ex.: a configuração padrão gravada em
+            # segundo plano ou a salva por save_config): mantém o cache, com as
+            # stop words adicionadas nesta execução
+            self._dados_config = data
+            return
+        self._aplicar_config(data)
+        logger.info("Stop words recarregadas de %s", self.config_file)
+    
+    def _aplicar_config(self, data: Dict[str, List[str]]) -> None:
+        """
+        Monta o cache de stop words a partir dos dados do arquivo de configuração.
+        
+        Args:
+            data (Dict[str, List[str]]): Listas de stop words por idioma
+        """
+        # Converte listas para frozensets (somente leitura, compartilháveis)
+        self.stop_words_cache = {idioma: frozenset(palavras) for idioma, palavras in data.items()}
+        self._dados_config = data
+    
     def _load_stop_words(self) -> None:
         """
         Carrega as stop words do arquivo de configuração.
         """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    
-                # Converte listas para sets para melhor performance
-                for idioma, palavras in data.items():
-                    self.stop_words_cache[idioma] = set(palavras)
-                    
-                logger.info(f"Stop words carregadas para {len(self.stop_words_cache)} idiomas")
-            else:
-                logger.warning(f"Arquivo de configuração não encontrado: {self.config_file}")
-                self._create_default_config()
+            self._aplicar_config(_ler_config(self.config_file))
+                
+            logger.info("Stop words carregadas para %d idiomas", len(self.stop_words_cache))
                 
+        except FileNotFoundError:
+            logger.warning("Arquivo de configuração não encontrado: %s", self.config_file)
+            self._create_default_config()
         except Exception as e:
-            logger.error(f"Erro ao carregar stop words: {e}")
+            logger.error("Erro ao carregar stop words: %s", e)
             self._create_default_config()
     
     def _create_default_config(self) -> None:
         """
         Cria configuração padrão se o arquivo não existir.
+        
+        O cache é preenchido imediatamente; a gravação do arquivo acontece em
+        segundo plano, fora do caminho crítico da inicialização. A thread não é
+        daemon: o interpretador aguarda a gravação terminar antes de encerrar.
         """
-        default_stop_words = {
-            "portugues": [
-                "a", "o", "e", "é", "de", "do", "da", "em", "um", "para", "com", "não", "uma",
-                "os", "no", "se", "na", "por", "mais", "as", "dos", "como", "mas", "foi", "ele", "das"
-            ],
-            "ingles": [
-                "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "he", "in", "is", "it", "its", "of", "on", "that", "the", "to", "was", "will", "with",
-                "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your", "yours", "yourself", "yourselves"
-            ]
-        }
+        # Carrega a configuração padrão
+        self.stop_words_cache = {idioma: frozenset(palavras) for idioma, palavras in _DEFAULT_STOP_WORDS.items()}
+        self._dados_config = _DEFAULT_STOP_WORDS
         
+        self._gravacao_padrao = threading.Thread(target=self._write_default_atomic)
+        self._gravacao_padrao.start()
+    
+    def _write_default_atomic(self) -> None:
+        """
+        Grava a configuração padrão em um arquivo temporário e o move para o
+        destino, de modo que o arquivo nunca fique parcialmente escrito.
+        """
+        temporario = f"{self.config_file}.{os.getpid()}.tmp"
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as file:
-                json.dump(default_stop_words, file, indent=2, ensure_ascii=False)
+            with open(temporario, 'wb') as file:
+                file.write(_DEFAULT_CONFIG_BYTES)
+            os.replace(temporario, self.config_file)
             
-            # Carrega a configuração padrão
-            for idioma, palavras in default_stop_words.items():
-                self.stop_words_cache[idioma] = set(palavras)
-                
-            logger.info(f"Arquivo de configuração padrão criado: {self.config_file}")
+            logger.info("Arquivo de configuração padrão criado: %s", self.config_file)
             
         except Exception as e:
-            logger.error(f"Erro ao criar configuração padrão: {e}")
-            # Fallback com stop words básicas
-            self.stop_words_cache = {
-                "portugues": {"a", "o", "e", "de", "em", "um", "para", "com"},
-                "ingles": {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "the", "to", "in", "is", "it"}
-            }
+            logger.error("Erro ao criar configuração padrão: %s", e)
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
     
-    def get_stop_words(self, idioma: str = "portugues") -> Set[str]:
+    def get_stop_words(self, idioma: str = "portugues") -> FrozenSet[str]:
         """
         Retorna as stop words para um idioma específico.
         
@@ -88,9 +327,9 @@ class StopWordsManager:
             idioma (str): Idioma das stop words ('portugues', 'ingles', 'espanhol')
             
         Returns:
-            Set[str]: Conjunto de stop words
+            FrozenSet[str]: Conjunto (somente leitura) de stop words
         """
-        return self.stop_words_cache.get(idioma, set())
+        return self.stop_words_cache.get(idioma, _EMPTY)
     
     def add_stop_words(self, idioma: str, palavras: List[str]) -> None:
         """
@@ -100,11 +339,8 @@ class StopWordsManager:
             idioma (str): Idioma das stop words
             palavras (List[str]): Lista de palavras a adicionar
         """
-        if idioma not in self.stop_words_cache:
-            self.stop_words_cache[idioma] = set()
-        
-        self.stop_words_cache[idioma].update(palavras)
-        logger.info(f"Adicionadas {len(palavras)} stop words para {idioma}")
+        self.stop_words_cache[idioma] = self.stop_words_cache.get(idioma, _EMPTY).union(palavras)
+        logger.info("Adicionadas %d stop words para %s", len(palavras), idioma)
     
     def remove_stop_words(self, idioma: str, palavras: List[str]) -> None:
         """
@@ -115,26 +351,35 @@ class StopWordsManager:
             palavras (List[str]): Lista de palavras a remover
         """
         if idioma in self.stop_words_cache:
-            self.stop_words_cache[idioma].difference_update(palavras)
-            logger.info(f"Removidas {len(palavras)} stop words de {idioma}")
+            self.stop_words_cache[idioma] = self.stop_words_cache[idioma].difference(palavras)
+            logger.info("Removidas %d stop words de %s", len(palavras), idioma)
     
     def save_config(self) -> None:
         """
         Salva a configuração atual no arquivo JSON.
         """
+        # Aguarda a gravação da configuração padrão, para que ela não
+        # sobrescreva o arquivo salvo aqui
+        if self._gravacao_padrao is not None:
+            self._gravacao_padrao.join()
+        
         try:
             # Converte sets de volta para listas para serialização JSON
-            config_data = {}
-            for idioma, palavras_set in self.stop_words_cache.items():
-                config_data[idioma] = sorted(list(palavras_set))
+            config_data = {idioma: sorted(palavras) for idioma, palavras in self.stop_words_cache.items()}
             
-            with open(self.config_file, 'w', encoding='utf-8') as file:
-                json.dump(config_data, file, indent=2, ensure_ascii=False)
+            if orjson:
+                dados = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+            else:
+                dados = json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            with open(self.config_file, 'wb') as file:
+                file.write(dados)
+            self._dados_config = config_data
             
-            logger.info(f"Configuração salva em: {self.config_file}")
+            logger.info("Configuração salva em: %s", self.config_file)
             
         except Exception as e:
-            logger.error(f"Erro ao salvar configuração: {e}")
+            logger.error("Erro ao salvar configuração: %s", e)
     
     def get_available_languages(self) -> List[str]:
         """
@@ -145,33 +390,23 @@ class StopWordsManager:
         """
         return list(self.stop_words_cache.keys())
     
-    def detect_language(self, texto: str) -> str:
+    def detect_language(self, texto: str = "", tokens: Optional[Iterable[str]] = None) -> str:
         """
         Detecta o idioma do texto baseado nas palavras mais comuns.
         
         Args:
             texto (str): Texto para análise
+            tokens (Iterable[str], optional): Palavras já tokenizadas e em minúsculas;
+                quando informadas, o texto não é tokenizado novamente
             
         Returns:
             str: Idioma detectado ('portugues', 'ingles', 'espanhol')
         """
-        # Palavras características de cada idioma
-        indicadores = {
-            "portugues": {"de", "da", "do", "em", "um", "uma", "para", "com", "não", "que", "se", "por", "mais", "as", "dos", "como", "mas", "foi", "ele", "das"},
-            "ingles": {"the", "and", "of", "to", "a", "in", "is", "it", "you", "that", "he", "was", "for", "on", "are", "as", "with", "his", "they", "at"},
-            "espanhol": {"de", "la", "el", "en", "y", "a", "los", "se", "del", "las", "un", "por", "con", "no", "una", "su", "para", "es", "al", "lo"}
-        }
-        
-        # Converte texto para minúsculas e divide em palavras
-        palavras = set(texto.lower().split())
-        
-        # Conta ocorrências de palavras características
-        scores = {}
-        for idioma, palavras_caracteristicas in indicadores.items():
-            scores[idioma] = len(palavras.intersection(palavras_caracteristicas))
+        if tokens is not None:
+            return _detectar_idioma_tokens(tokens)
         
-        # Retorna o idioma com mais palavras características
-        if scores:
-            return max(scores, key=scores.get)
+        # Textos curtos (como amostras de documentos) são memorizados
+        if len(texto) <= _DETECCAO_CACHE_MAX_CHARS:
+            return _detectar_idioma_texto(texto)
         
-        return "portugues"  # Padrão
+        return _detectar_idioma_texto.__wrapped__(texto)
@@ -6,6 +6,22 @@ import subprocess
 import sys
 import os
 import logging
+import importlib
+import urllib.request
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+
+# Índice de pacotes usado por cada método online (o 1 e o 2 usam o PyPI)
+_INDICE_PYPI = "https://pypi.org/simple/"
+_INDICE_MIRROR = "https://pypi.tuna.tsinghua.edu.cn/simple/"
+
+def _indice_acessivel(url, timeout=10):
+    """Verifica se o índice de pacotes responde, sem instalar nada"""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=timeout):
+            return True
+    except Exception:
+        return False
 
 def instalar_com_metodo_1():
     """Método 1: Instalação com hosts confiáveis"""
@@ -47,7 +63,7 @@ def instalar_com_metodo_3():
     try:
         comando = [
             sys.executable, "-m", "pip", "install",
-            "-i", "https://pypi.tuna.tsinghua.edu.cn/simple/",
+            "-i", _INDICE_MIRROR,
             "PyPDF2"
         ]
         subprocess.check_call(comando)
@@ -67,14 +83,14 @@ def instalar_com_metodo_4():
     return False
 
 def verificar_instalacao():
-    """Verifica se PyPDF2 está instalado"""
-    try:
-        import PyPDF2
+    """Verifica se PyPDF2 está instalado, sem importar (e inicializar) o pacote"""
+    # Descarta caches dos finders para enxergar pacotes recém-instalados
+    importlib.invalidate_caches()
+    if find_spec("PyPDF2") is not None:
         print("✅ PyPDF2 já está instalado!")
         return True
-    except ImportError:
-        print("❌ PyPDF2 não está instalado")
-        return False
+    print("❌ PyPDF2 não está instalado")
+    return False
 
 def main():
     print("=== INSTALADOR DE DEPENDÊNCIAS - ANALISADOR DOCUMENTAL ===\n")
@@ -85,14 +101,22 @@ def main():
     
     print("Tentando instalar PyPDF2...\n")
     
-    # Tenta diferentes métodos
+    # Testa os índices em paralelo (só uma requisição a cada um) e tenta
+    # primeiro os métodos cujo índice respondeu, evitando esperar o timeout
+    # do pip em um índice inacessível. A instalação continua sequencial: um
+    # único pip por vez escreve no site-packages
     metodos = [
-        instalar_com_metodo_1,
-        instalar_com_metodo_2,
-        instalar_com_metodo_3
+        (instalar_com_metodo_1, _INDICE_PYPI),
+        (instalar_com_metodo_2, _INDICE_PYPI),
+        (instalar_com_metodo_3, _INDICE_MIRROR)
     ]
+    indices = list(dict.fromkeys(indice for _, indice in metodos))
+    with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+        acessiveis = dict(zip(indices, executor.map(_indice_acessivel, indices)))
+    # A ordenação é estável: a ordem original é mantida dentro de cada grupo
+    metodos.sort(key=lambda item: not acessiveis[item[1]])
     
-    for i, metodo in enumerate(metodos, 1):
+    for i, (metodo, _) in enumerate(metodos, 1):
         print(f"\n--- Tentativa {i} ---")
         if metodo():
             break
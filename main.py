@@ -1,7 +1,18 @@
+import atexit
+import gzip
+import hashlib
+import heapq
+import io
 import os
+import pickle
 import re
+import sys
+from array import array
 from collections import Counter
-from typing import List, Dict, Tuple, Optional, Union
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import FrozenSet, Iterable, Iterator, List, Dict, TextIO, Tuple, Optional, Union
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -10,10 +21,646 @@ from urllib.parse import urlparse
 # Importa o gerenciador de stop words
 from config import StopWordsManager
 
+# Bibliotecas de PDF (opcionais), verificadas uma única vez na importação;
+# _PDF_BACKEND indica a preferida entre as disponíveis
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+# Flags de extração do PyMuPDF: mantém espaços, junta palavras hifenizadas no
+# fim da linha e expande ligaduras (fi, fl) em letras comuns
+_FLAGS_TEXTO_PYMUPDF = (
+    fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_DEHYPHENATE | fitz.TEXT_MEDIABOX_CLIP
+    if fitz is not None else 0
+)
+
+_PDF_BACKEND = 'pymupdf' if fitz is not None else 'pdfplumber' if pdfplumber is not None else None
+
+# numpy (opcional) acelera a contagem de frequências; sem ele, usa Counter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Parser HTML em C (opcional): selectolax com o motor lexbor ou, em versões
+# antigas sem ele, o motor Modest (mesma API); sem selectolax, usa BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    except ImportError:
+        SelectolaxHTMLParser = None
+
+# Parser usado pelo BeautifulSoup: lxml (em C) se instalado, senão o html.parser
+try:
+    import lxml  # noqa: F401
+    _PARSER_BS4 = 'lxml'
+except ImportError:
+    _PARSER_BS4 = 'html.parser'
+
+# openpyxl (opcional) para a exportação em Excel, verificado uma única vez
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    openpyxl = None
+
 # Configuração de logging para debug e monitoramento
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Prefixos que identificam uma fonte web sem precisar de urlparse
+_ESQUEMAS_WEB = ('http://', 'https://', 'ftp://')
+
+# Todas as grafias da extensão .pdf (maiúsculas/minúsculas), para testar o
+# sufixo com endswith sem criar uma cópia do nome em minúsculas
+_EXTENSOES_PDF = tuple(f'.{p}{d}{f}' for p in 'pP' for d in 'dD' for f in 'fF')
+
+# Expressão regular compilada uma única vez; extrai palavras (letras e
+# dígitos) com pelo menos 3 caracteres, tratando qualquer pontuação como
+# separador. O tamanho mínimo é verificado pelo próprio regex, em C
+_PALAVRA_RE = re.compile(r'[^\W_]{3,}')
+
+# Tamanho (em caracteres) dos blocos em que o conteúdo é tokenizado; limita a
+# lista de tokens em memória a um bloco por vez
+_TAMANHO_BLOCO_TOKENS = 1 << 20
+
+# Amostra usada na detecção de idioma: início e fim do conteúdo (o idioma é
+# uniforme dentro de um documento)
+_AMOSTRA_IDIOMA_INICIO = 8192
+_AMOSTRA_IDIOMA_FIM = 4096
+
+# Extração paralela de PDFs: número máximo de processos (por PDF ou por pasta
+# de PDFs) e número mínimo de páginas para compensar o custo de iniciar os
+# processos na extração de um único PDF (com o método spawn, cada processo
+# importa o interpretador e este módulo de novo)
+_MAX_PROCESSOS_PDF = 8
+_MIN_PAGINAS_PARALELO = 200
+
+# Cache em disco do conteúdo extraído de PDFs (chave: caminho, mtime e tamanho)
+_DIR_CACHE = Path.home() / '.cache' / 'anpocs25'
+_VERSAO_CACHE = 2
+
+def _caminho_cache(caminho: str, st: Optional[os.stat_result] = None, sufixo: str = '') -> Optional[Path]:
+    """
+    Calcula o arquivo de cache de um PDF a partir do caminho absoluto, da data
+    de modificação e do tamanho do arquivo.
+    
+    Args:
+        caminho (str): Caminho do arquivo PDF
+        st (os.stat_result, optional): Resultado de os.stat já obtido para o arquivo
+        sufixo (str): Distingue entradas diferentes do mesmo PDF (ex: '.palavras')
+        
+    Returns:
+        Optional[Path]: Caminho do arquivo de cache ou None se o PDF não puder ser lido
+    """
+    if st is None:
+        try:
+            st = os.stat(caminho)
+        except OSError:
+            return None
+    chave = f"{os.path.abspath(caminho)}|{st.st_mtime_ns}|{st.st_size}"
+    return _DIR_CACHE / f"{hashlib.sha1(chave.encode('utf-8')).hexdigest()}{sufixo}.pkl.gz"
+
+def _caminho_cache_web(url: str) -> Path:
+    """
+    Calcula o arquivo de cache de uma página web (validadores ETag/Last-Modified
+    e corpo da última resposta) a partir da URL.
+    
+    Args:
+        url (str): URL da página
+        
+    Returns:
+        Path: Caminho do arquivo de cache
+    """
+    return _DIR_CACHE / 'web' / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pkl.gz"
+
+def _ler_cache(arquivo: Path) -> Optional[Dict[str, any]]:
+    """
+    Lê uma entrada do cache em disco.
+    
+    Args:
+        arquivo (Path): Arquivo de cache
+        
+    Returns:
+        Optional[Dict[str, any]]: Dados armazenados ou None se ausentes/inválidos
+    """
+    try:
+        with gzip.open(arquivo, 'rb') as f:
+            dados = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Cache inválido ignorado ({arquivo}): {e}")
+        return None
+    if not isinstance(dados, dict) or dados.get('versao') != _VERSAO_CACHE:
+        return None
+    return dados
+
+def _gravar_cache(arquivo: Path, dados: Dict[str, any]) -> None:
+    """
+    Grava uma entrada no cache em disco de forma atômica (arquivo temporário
+    seguido de os.replace).
+    
+    Args:
+        arquivo (Path): Arquivo de cache
+        dados (Dict[str, any]): Dados a armazenar
+    """
+    try:
+        arquivo.parent.mkdir(parents=True, exist_ok=True)
+        temporario = arquivo.with_name(f"{arquivo.name}.{os.getpid()}.tmp")
+        with gzip.open(temporario, 'wb', compresslevel=1) as f:
+            pickle.dump({'versao': _VERSAO_CACHE, **dados}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, arquivo)
+    except Exception as e:
+        logger.warning(f"Não foi possível gravar o cache ({arquivo}): {e}")
+
+def _iterar_textos_paginas_pymupdf(doc, inicio: int, fim: int) -> Iterator[str]:
+    """
+    Gera o texto (com espaços normalizados) de um intervalo de páginas de um
+    documento PyMuPDF já aberto, uma página por vez.
+    
+    Args:
+        doc (fitz.Document): Documento aberto
+        inicio (int): Índice da primeira página (inclusive)
+        fim (int): Índice da última página (exclusive)
+        
+    Yields:
+        str: Texto de cada página ('' para páginas sem texto ou com erro)
+    """
+    for i in range(inicio, fim):
+        try:
+            # Sem ordenação de blocos: a ordem do fluxo de conteúdo basta para
+            # contar palavras
+            texto_pagina = doc.load_page(i).get_text("text", flags=_FLAGS_TEXTO_PYMUPDF, sort=False)
+            yield ' '.join(texto_pagina.split())
+        except Exception as e:
+            logger.warning(f"Erro ao extrair página {i + 1}: {e}")
+            yield ''
+        
+        # Log de progresso a cada 10 páginas
+        if (i + 1) % 10 == 0:
+            logger.info(f"Página {i + 1} processada")
+
+
+def _iterar_blocos_palavras(texto: str) -> Iterator[List[str]]:
+    """
+    Gera as palavras (com 3 ou mais caracteres) do texto em blocos de cerca de
+    _TAMANHO_BLOCO_TOKENS caracteres, cortados sempre em um espaço para não
+    partir palavras.
+    
+    Args:
+        texto (str): Texto a tokenizar
+        
+    Yields:
+        List[str]: Palavras de cada bloco, na ordem do texto
+    """
+    inicio = 0
+    tamanho = len(texto)
+    while inicio < tamanho:
+        fim = inicio + _TAMANHO_BLOCO_TOKENS
+        if fim < tamanho:
+            corte = texto.rfind(' ', inicio, fim)
+            if corte <= inicio:
+                corte = texto.find(' ', fim)
+            fim = corte if corte != -1 else tamanho
+        # findall com pos/endpos evita copiar o bloco
+        yield _PALAVRA_RE.findall(texto, inicio, fim)
+        inicio = fim
+
+
+def _tokenizar_em_ids(conteudo: str, stop_words: FrozenSet[str]) -> Tuple[List[str], array]:
+    """
+    Extrai as palavras do conteúdo em minúsculas, descarta palavras curtas e
+    stop words e converte cada palavra mantida em um id inteiro.
+    
+    Args:
+        conteudo (str): Conteúdo a processar
+        stop_words (FrozenSet[str]): Stop words do idioma do conteúdo
+        
+    Returns:
+        Tuple[List[str], array]: Vocabulário (id -> palavra) e ids das
+            palavras na ordem do texto
+    """
+    # Palavras curtas já foram descartadas pelo regex; aqui saem as palavras
+    # comuns. Cada palavra mantida vira um id inteiro no vocabulário; as palavras
+    # novas são internadas para compartilhar o mesmo objeto entre documentos.
+    # O resultado de cada token (como aparece no texto) é memorizado, então
+    # minúsculas e filtros só rodam na primeira ocorrência de cada forma.
+    vocabulario: Dict[str, int] = {}
+    id_por_token: Dict[str, int] = {}
+    ids = array('i')
+    adicionar_id = ids.append
+    internar = sys.intern
+    # As palavras são extraídas do conteúdo original (sem cópia em
+    # minúsculas do documento inteiro), um bloco por vez
+    for tokens in _iterar_blocos_palavras(conteudo):
+        for token in tokens:
+            id_palavra = id_por_token.get(token)
+            if id_palavra is None:
+                palavra = token.lower()
+                if palavra not in stop_words:
+                    id_palavra = vocabulario.get(palavra)
+                    if id_palavra is None:
+                        id_palavra = vocabulario[internar(palavra)] = len(vocabulario)
+                else:
+                    id_palavra = -1
+                id_por_token[token] = id_palavra
+            if id_palavra >= 0:
+                adicionar_id(id_palavra)
+    
+    return list(vocabulario), ids
+
+
+def _juntar_textos_paginas(textos: Iterable[str]) -> str:
+    """
+    Junta os textos das páginas, na ordem em que são gerados, separados por
+    espaço e ignorando páginas vazias.
+    
+    Args:
+        textos (Iterable[str]): Texto de cada página
+        
+    Returns:
+        str: Conteúdo completo do documento
+    """
+    buffer = io.StringIO()
+    for texto_pagina in textos:
+        if texto_pagina:
+            buffer.write(texto_pagina)
+            buffer.write(' ')
+    return buffer.getvalue().strip()
+
+
+def _extrair_intervalo_pymupdf(caminho: str, inicio: int, fim: int) -> List[str]:
+    """
+    Abre o PDF e extrai um intervalo de páginas; executada nos processos de
+    extração paralela de _extrair_com_pymupdf.
+    
+    Args:
+        caminho (str): Caminho do arquivo PDF
+        inicio (int): Índice da primeira página (inclusive)
+        fim (int): Índice da última página (exclusive)
+        
+    Returns:
+        List[str]: Texto de cada página do intervalo
+    """
+    doc = fitz.open(caminho)
+    try:
+        if doc.needs_pass:
+            doc.authenticate("")
+        return list(_iterar_textos_paginas_pymupdf(doc, inicio, fim))
+    finally:
+        doc.close()
+
+
+# Modelos do relatório de um documento: as seções de informações da fonte
+# (PDF ou web) e o corpo comum, preenchidos com str.format
+_SEPARADOR_RELATORIO = "=" * 80
+
+_MODELO_INFO_PDF = """\
+- Tipo: {tipo}
+- Nome: {nome}
+- Caminho: {caminho_completo}
+- Tamanho: {tamanho}
+- Data de modificação: {data_modificacao}
+- Total de páginas: {total_paginas}
+- Versão PDF: {versao_pdf}
+- Criptografado: {criptografado}"""
+
+_MODELO_INFO_WEB = """\
+- Tipo: {tipo}
+- URL: {url}
+- Título: {titulo}
+- Tamanho: {tamanho}
+- Data de acesso: {data_acesso}
+- Status: {status_code}
+- Content-Type: {content_type}
+- Encoding: {encoding}"""
+
+_MODELO_RELATORIO = """\
+{separador}
+RELATÓRIO DE ANÁLISE DOCUMENTAL
+{separador}
+INFORMAÇÕES DA FONTE:
+{info}{metadados}
+
+ESTATÍSTICAS GERAIS:
+- Total de palavras: {total_palavras:,}
+- Palavras únicas: {palavras_unicas:,}
+- Densidade de vocabulário: {densidade_vocabulario}%
+- Tamanho do conteúdo: {tamanho_conteudo:,} caracteres
+- Idioma detectado: {idioma_detectado}
+
+TOP {top_n} PALAVRAS MAIS FREQUENTES:{ranking}
+
+{separador}"""
+
+# Relatório de múltiplos documentos: informações gerais e detalhes de cada documento
+_MODELO_INFO_MULTIPLOS = """\
+INFORMAÇÕES GERAIS:
+- Pasta analisada: {pasta_analisada}
+- Data da análise: {data_analise}
+- Total de documentos: {total_documentos}
+- Total de palavras: {total_palavras:,}
+- Total de palavras únicas: {total_palavras_unicas:,}
+- Densidade de vocabulário geral: {densidade_vocabulario_geral}%
+- Tamanho total do conteúdo: {tamanho_conteudo_total:,} caracteres"""
+
+_MODELO_DETALHES_DOCUMENTO = """
+DOCUMENTO {indice}: {nome}
+  - Caminho: {caminho}
+  - Total de palavras: {total_palavras:,}
+  - Palavras únicas: {palavras_unicas:,}
+  - Densidade de vocabulário: {densidade_vocabulario}%
+  - Tamanho do conteúdo: {tamanho_conteudo:,} caracteres
+  - Idioma: {idioma}
+  - Total de páginas: {total_paginas}
+  - Tamanho do arquivo: {tamanho_arquivo}
+
+  TOP 20 PALAVRAS MAIS FREQUENTES (DOCUMENTO {indice}):"""
+
+def _renderizar_info_pdf(info: Dict[str, any]) -> str:
+    """
+    Monta a seção de informações da fonte do relatório para um PDF.
+    
+    Args:
+        info (Dict[str, any]): Informações da fonte
+        
+    Returns:
+        str: Linhas da seção, separadas por quebra de linha
+    """
+    return _MODELO_INFO_PDF.format_map({
+        **info,
+        'tamanho': _formatar_tamanho(info['tamanho_bytes']),
+        'criptografado': 'Sim' if info['criptografado'] else 'Não',
+    })
+
+
+def _renderizar_info_web(info: Dict[str, any]) -> str:
+    """
+    Monta a seção de informações da fonte do relatório para uma página web.
+    
+    Args:
+        info (Dict[str, any]): Informações da fonte
+        
+    Returns:
+        str: Linhas da seção, separadas por quebra de linha
+    """
+    return _MODELO_INFO_WEB.format_map({**info, 'tamanho': _formatar_tamanho(info['tamanho_bytes'])})
+
+
+# Seção de informações do relatório por tipo de fonte
+_RENDERIZADORES_INFO = {
+    'pdf': _renderizar_info_pdf,
+    'web': _renderizar_info_web,
+}
+
+# Unidades usadas na formatação de tamanhos de arquivo
+_UNIDADES_TAMANHO = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def _formatar_tamanho(bytes_size: int) -> str:
+    """
+    Formata o tamanho em bytes para uma representação legível.
+    
+    Args:
+        bytes_size (int): Tamanho em bytes
+        
+    Returns:
+        str: Tamanho formatado (ex: "1.5 MB")
+    """
+    if bytes_size < 1024:
+        return f"{bytes_size:.1f} B"
+    # Cada unidade é 2**10 vezes a anterior: o número de bits indica a unidade
+    indice = min((int(bytes_size).bit_length() - 1) // 10, len(_UNIDADES_TAMANHO) - 1)
+    return f"{bytes_size / (1 << (10 * indice)):.1f} {_UNIDADES_TAMANHO[indice]}"
+
+# Tamanho máximo baixado de uma página web (o restante é descartado)
+_MAX_BYTES_PAGINA = 5 * 1024 * 1024
+
+def _contar_ids(ids: array, tamanho_vocabulario: int):
+    """
+    Conta as ocorrências de cada id de palavra.
+    
+    Args:
+        ids (array): Ids das palavras na ordem do texto
+        tamanho_vocabulario (int): Número de palavras distintas
+        
+    Returns:
+        numpy.ndarray | List[int]: Contagem de ocorrências por id (numpy.ndarray
+            quando numpy está instalado)
+    """
+    if np is not None:
+        return np.bincount(np.frombuffer(ids, dtype=np.int32), minlength=tamanho_vocabulario)
+    
+    contagens = [0] * tamanho_vocabulario
+    for id_palavra, quantidade in Counter(ids).items():
+        contagens[id_palavra] = quantidade
+    return contagens
+
+
+def _ids_mais_frequentes(contagens, top_n: int) -> List[int]:
+    """
+    Seleciona os ids das top_n palavras mais frequentes. Empates são desfeitos
+    pelo menor id (ordem de primeira ocorrência), como em Counter.most_common.
+    
+    Args:
+        contagens (numpy.ndarray | List[int]): Contagem de ocorrências por id
+        top_n (int): Número de palavras a selecionar
+        
+    Returns:
+        List[int]: Ids ordenados por frequência decrescente
+    """
+    total_unicas = len(contagens)
+    if top_n <= 0:
+        return []
+    
+    if isinstance(contagens, list):
+        # Sem numpy: seleção parcial com heap, O(V log top_n), em vez de
+        # ordenar o vocabulário inteiro
+        return heapq.nlargest(top_n, range(total_unicas), key=contagens.__getitem__)
+    
+    if top_n < total_unicas:
+        # Frequência da top_n-ésima palavra; só as palavras com pelo menos essa
+        # frequência precisam ser ordenadas
+        limiar = -np.partition(-contagens, top_n - 1)[top_n - 1]
+        candidatos = np.flatnonzero(contagens >= limiar)
+    else:
+        candidatos = np.arange(total_unicas)
+    ordem = np.argsort(-contagens[candidatos], kind='stable')
+    return candidatos[ordem[:top_n]].tolist()
+
+
+def _frequencias_de_palavras(vocabulario: List[str], contagens, palavras: Iterable[str]) -> List[int]:
+    """
+    Retorna a frequência de cada palavra pedida no documento (0 se ausente),
+    a partir das contagens completas e não só de um ranking.
+    
+    Args:
+        vocabulario (List[str]): Palavras distintas do documento (id -> palavra)
+        contagens (numpy.ndarray | List[int]): Contagem de ocorrências por id
+        palavras (Iterable[str]): Palavras a consultar
+        
+    Returns:
+        List[int]: Frequência de cada palavra, na ordem pedida
+    """
+    ids = {palavra: i for i, palavra in enumerate(vocabulario)}
+    return [int(contagens[ids[palavra]]) if palavra in ids else 0 for palavra in palavras]
+
+
+# Sessão HTTP compartilhada (keep-alive e pool de conexões entre requisições);
+# com requests-cache instalado, as páginas ficam em cache por _HTTP_CACHE_EXPIRACAO
+_sessao_http = None
+_HTTP_CACHE_EXPIRACAO = 24 * 60 * 60
+
+def _resposta_cabe_no_limite(resposta) -> bool:
+    """
+    Filtro do requests-cache: só grava respostas com Content-Length declarado
+    e de até _MAX_BYTES_PAGINA. Gravar uma resposta exige ler o corpo inteiro,
+    o que ignoraria o limite aplicado na leitura em streaming.
+    
+    Args:
+        resposta (requests.Response): Resposta recebida ou lida do cache
+        
+    Returns:
+        bool: True se a resposta pode ficar no cache
+    """
+    try:
+        return int(resposta.headers.get('Content-Length', '')) <= _MAX_BYTES_PAGINA
+    except ValueError:
+        return False
+
+def _obter_sessao():
+    """
+    Retorna a sessão HTTP compartilhada, criando-a na primeira chamada.
+    
+    Returns:
+        requests.Session: Sessão com cabeçalhos padrão, pool de conexões e novas
+            tentativas em falhas transitórias (uma requests_cache.CachedSession
+            em ~/.cache/anpocs25 se disponível)
+        
+    Raises:
+        ImportError: Se requests não estiver instalado
+    """
+    global _sessao_http
+    if _sessao_http is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # Só anuncia brotli se houver decodificador instalado
+        codificacoes = 'gzip, deflate'
+        try:
+            import brotli  # noqa: F401
+            codificacoes += ', br'
+        except ImportError:
+            pass
+        
+        try:
+            import requests_cache
+            sessao = requests_cache.CachedSession(
+                str(_DIR_CACHE / 'http'),
+                backend='sqlite',
+                expire_after=_HTTP_CACHE_EXPIRACAO,
+                allowable_methods=('GET', 'HEAD'),
+                filter_fn=_resposta_cabe_no_limite,
+            )
+        except ImportError:
+            sessao = requests.Session()
+        sessao.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': codificacoes,
+        })
+        # Repete falhas de conexão e respostas transitórias (429/5xx) com espera
+        # exponencial; o status final ainda passa por raise_for_status
+        tentativas = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                           raise_on_status=False)
+        adaptador = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=tentativas)
+        sessao.mount('http://', adaptador)
+        sessao.mount('https://', adaptador)
+        # Fecha as conexões do pool (e o banco do cache) ao encerrar
+        atexit.register(sessao.close)
+        _sessao_http = sessao
+    return _sessao_http
+
+
+def _extrair_titulo_e_metadados_html(html: bytes) -> Tuple[str, Dict[str, str]]:
+    """
+    Extrai o título e as meta tags (name/property -> content) de uma página HTML.
+    
+    Args:
+        html (bytes): Conteúdo HTML da página
+        
+    Returns:
+        Tuple[str, Dict[str, str]]: Título da página e dicionário de meta tags
+        
+    Raises:
+        ImportError: Se nem selectolax nem beautifulsoup4 estiverem instalados
+    """
+    meta_tags = {}
+    
+    if SelectolaxHTMLParser is not None:
+        arvore = SelectolaxHTMLParser(html)
+        titulo = arvore.css_first('title')
+        titulo_texto = titulo.text(strip=True) if titulo else ''
+        for meta in arvore.css('meta'):
+            atributos = meta.attributes
+            name = atributos.get('name') or atributos.get('property')
+            content = atributos.get('content')
+            if name and content:
+                meta_tags[name] = content
+        return titulo_texto or 'Sem título', meta_tags
+    
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, _PARSER_BS4)
+    titulo = soup.find('title')
+    titulo_texto = titulo.get_text().strip() if titulo else 'Sem título'
+    for meta in soup.find_all('meta'):
+        name = meta.get('name') or meta.get('property')
+        content = meta.get('content')
+        if name and content:
+            meta_tags[name] = content
+    return titulo_texto, meta_tags
+
+
+def _extrair_texto_html(html: bytes) -> str:
+    """
+    Extrai o texto visível de uma página HTML, ignorando scripts, estilos e
+    elementos de navegação (nav, footer, header).
+    
+    Args:
+        html (bytes): Conteúdo HTML da página
+        
+    Returns:
+        str: Texto extraído (ainda sem limpeza de espaços)
+        
+    Raises:
+        ImportError: Se nem selectolax nem beautifulsoup4 estiverem instalados
+    """
+    if SelectolaxHTMLParser is not None:
+        arvore = SelectolaxHTMLParser(html)
+        for tag in arvore.css('script,style,nav,footer,header'):
+            tag.decompose()
+        raiz = arvore.body or arvore.root
+        return raiz.text(separator=' ', strip=True) if raiz else ''
+    
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, _PARSER_BS4)
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+    return soup.get_text(separator=' ', strip=True)
+
+
 class AnalisadorDocumental:
     """
     Classe para análise de documentos PDF e páginas web com funcionalidades de processamento de texto
@@ -25,12 +672,22 @@ class AnalisadorDocumental:
         conteudo (str): Conteúdo extraído da fonte
         palavras_processadas (List[str]): Lista de palavras após limpeza
         api_key (str): Chave da API da OpenAI
+        usar_cache (bool): Se o cache em disco (conteúdo de PDFs e cópia de páginas web) é usado
         info_fonte (Dict): Informações gerais da fonte
         stop_words_manager (StopWordsManager): Gerenciador de stop words
         idioma_detectado (str): Idioma detectado do conteúdo
+    
+    A extração de informações e de conteúdo e o processamento das palavras só
+    acontecem no primeiro acesso a info_fonte, conteudo ou às análises.
+    
+    PDFs com muitas páginas são extraídos em processos separados. No Windows e
+    no macOS (método spawn) esses processos importam de novo o script
+    principal, que deve proteger o código de nível de módulo com
+    "if __name__ == '__main__':".
     """
     
-    def __init__(self, fonte: str, api_key: Optional[str] = None, idioma: Optional[str] = None):
+    def __init__(self, fonte: str, api_key: Optional[str] = None, idioma: Optional[str] = None,
+                 usar_cache: bool = True):
         """
         Inicializa o analisador de documentos.
         
@@ -38,23 +695,86 @@ class AnalisadorDocumental:
             fonte (str): Caminho para arquivo PDF ou URL da página web
             api_key (str, optional): Chave da API da OpenAI para análise com ChatGPT
             idioma (str, optional): Idioma para stop words ('portugues', 'ingles', 'espanhol')
+            usar_cache (bool): Reaproveita o conteúdo já extraído de um PDF não modificado
+                e revalida páginas web já baixadas
+                (cache em ~/.cache/anpocs25)
         """
         self.fonte = fonte
+        self._stat_fonte: Optional[os.stat_result] = None
         self.tipo_fonte = self._determinar_tipo_fonte(fonte)
-        self.conteudo = ""
-        self.palavras_processadas = []
+        self._contagens = None
+        self._ranking: List[Tuple[str, int]] = []
+        self._estatisticas: Optional[Dict[str, any]] = None
+        self._palavras_processadas: Optional[List[str]] = None
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        self.info_fonte = {}
-        
-        # Inicializa gerenciador de stop words
-        self.stop_words_manager = StopWordsManager()
-        self.idioma_detectado = idioma
+        self.usar_cache = usar_cache
+        self._cache_consultado = False
+        self._conteudo_simulado = False
+        self._resposta_web = None
+        
+        # Gerenciador de stop words compartilhado entre os analisadores
+        self.stop_words_manager = StopWordsManager.get()
+        self._idioma = idioma
+        
+        # Métodos específicos do tipo de fonte, escolhidos uma única vez
+        manipuladores = {
+            'pdf': (self._validar_pdf, self._extrair_informacoes_pdf, self._extrair_conteudo_pdf),
+            'web': (self._validar_web, self._extrair_informacoes_web, self._extrair_conteudo_web),
+        }
+        self._validar_tipo, self._extrair_informacoes_tipo, self._extrair_conteudo_tipo = \
+            manipuladores[self.tipo_fonte]
+        self._renderizar_info = _RENDERIZADORES_INFO[self.tipo_fonte]
         
-        # Validação inicial
+        # Validação inicial (a extração fica para o primeiro uso)
         self._validar_fonte()
-        self._extrair_informacoes_fonte()
-        self._extrair_conteudo()
+    
+    @cached_property
+    def info_fonte(self) -> Dict[str, any]:
+        """
+        Informações gerais da fonte, extraídas no primeiro acesso.
+        """
+        if not self._carregar_do_cache():
+            self._extrair_informacoes_fonte()
+        return self.__dict__.get('info_fonte', {})
+    
+    @cached_property
+    def conteudo(self) -> str:
+        """
+        Conteúdo textual da fonte, extraído no primeiro acesso.
+        """
+        if not self._carregar_do_cache():
+            self._extrair_conteudo()
+            self._salvar_no_cache()
+        return self.__dict__.get('conteudo', '')
+    
+    @cached_property
+    def _vocabulario(self) -> List[str]:
+        """
+        Vocabulário das palavras processadas (id -> palavra).
+        """
         self._processar_palavras()
+        return self.__dict__['_vocabulario']
+    
+    @cached_property
+    def _ids(self) -> array:
+        """
+        Ids das palavras processadas, na ordem do texto.
+        """
+        self._processar_palavras()
+        return self.__dict__['_ids']
+    
+    @property
+    def idioma_detectado(self) -> Optional[str]:
+        """
+        Idioma informado na construção ou detectado ao processar as palavras.
+        """
+        if not self._idioma:
+            self._ids  # a detecção acontece no processamento das palavras
+        return self._idioma
+    
+    @idioma_detectado.setter
+    def idioma_detectado(self, idioma: Optional[str]) -> None:
+        self._idioma = idioma
     
     def _determinar_tipo_fonte(self, fonte: str) -> str:
         """
@@ -66,25 +786,45 @@ class AnalisadorDocumental:
         Returns:
             str: 'pdf' ou 'web'
         """
-        # Verifica se é uma URL
-        try:
-            resultado = urlparse(fonte)
-            if resultado.scheme and resultado.netloc:
-                return 'web'
-        except:
-            pass
+        # Verifica se é uma URL: os prefixos comuns dispensam o urlparse; os
+        # demais esquemas (ou em maiúsculas, como HTTPS://) só têm netloc
+        # quando há '//' na fonte
+        if fonte.startswith(_ESQUEMAS_WEB):
+            return 'web'
+        if '//' in fonte:
+            try:
+                resultado = urlparse(fonte)
+                if resultado.scheme and resultado.netloc:
+                    return 'web'
+            except ValueError:
+                pass
         
         # Verifica se é um arquivo PDF
-        if fonte.lower().endswith('.pdf'):
+        if fonte.endswith(_EXTENSOES_PDF):
             return 'pdf'
         
         # Verifica se é um caminho de arquivo existente
-        if os.path.exists(fonte):
+        if self._obter_stat_fonte() is not None:
             return 'pdf'
         
         # Se não conseguir determinar, assume que é web
         return 'web'
     
+    def _obter_stat_fonte(self) -> Optional[os.stat_result]:
+        """
+        Executa os.stat na fonte uma única vez, reaproveitando o resultado na
+        detecção do tipo, na validação e nas informações do arquivo.
+        
+        Returns:
+            Optional[os.stat_result]: Resultado de os.stat ou None se o arquivo não existir
+        """
+        if self._stat_fonte is None:
+            try:
+                self._stat_fonte = os.stat(self.fonte)
+            except OSError:
+                return None
+        return self._stat_fonte
+    
     def _normalizar_caminho(self, caminho: str) -> str:
         """
         Normaliza o caminho do arquivo para evitar problemas de encoding no Windows.
@@ -112,38 +852,138 @@ class AnalisadorDocumental:
             ValueError: Se a fonte não for válida
         """
         try:
-            if self.tipo_fonte == 'pdf':
-                if not os.path.exists(self.fonte):
-                    raise FileNotFoundError(f"Arquivo não encontrado: {self.fonte}")
-                
-                if not self.fonte.lower().endswith('.pdf'):
-                    raise ValueError("O arquivo deve ser um PDF")
-            
-            elif self.tipo_fonte == 'web':
-                # Validação básica de URL
-                try:
-                    resultado = urlparse(self.fonte)
-                    if not resultado.scheme or not resultado.netloc:
-                        raise ValueError("URL inválida")
-                except Exception as e:
-                    raise ValueError(f"URL inválida: {e}")
-            
+            self._validar_tipo()
             logger.info(f"Fonte validada: {self.fonte} (tipo: {self.tipo_fonte})")
             
         except Exception as e:
             logger.error(f"Erro na validação da fonte: {e}")
             raise
     
+    def _validar_pdf(self) -> None:
+        """
+        Valida se o arquivo PDF existe e tem extensão .pdf.
+        
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            ValueError: Se o arquivo não for um PDF
+        """
+        if self._obter_stat_fonte() is None:
+            raise FileNotFoundError(f"Arquivo não encontrado: {self.fonte}")
+        
+        if not self.fonte.endswith(_EXTENSOES_PDF):
+            raise ValueError("O arquivo deve ser um PDF")
+    
+    def _validar_web(self) -> None:
+        """
+        Validação básica da URL.
+        
+        Raises:
+            ValueError: Se a URL não for válida
+        """
+        try:
+            resultado = urlparse(self.fonte)
+            if not resultado.scheme or not resultado.netloc:
+                raise ValueError("URL inválida")
+        except Exception as e:
+            raise ValueError(f"URL inválida: {e}")
+    
+    def _carregar_do_cache(self) -> bool:
+        """
+        Carrega informações e conteúdo de um PDF a partir do cache em disco.
+        
+        Returns:
+            bool: True se o cache foi usado, False caso contrário
+        """
+        if not self.usar_cache or self.tipo_fonte != 'pdf' or self._cache_consultado:
+            return False
+        self._cache_consultado = True
+        
+        arquivo = _caminho_cache(self.fonte, self._obter_stat_fonte())
+        dados = _ler_cache(arquivo) if arquivo else None
+        if dados is None:
+            return False
+        
+        # O mesmo arquivo pode ter sido aberto por outro caminho (relativo ou
+        # absoluto): os campos de caminho vêm da fonte atual
+        self.info_fonte = {
+            **dados['info_fonte'],
+            'nome': os.path.basename(self.fonte),
+            'caminho_completo': self.fonte,
+        }
+        self.conteudo = dados['conteudo']
+        logger.info(f"Conteúdo carregado do cache: {len(self.conteudo)} caracteres")
+        return True
+    
+    def _salvar_no_cache(self) -> None:
+        """
+        Grava informações e conteúdo extraídos de um PDF no cache em disco.
+        Conteúdo simulado e informações incompletas nunca são gravados.
+        """
+        if not self.usar_cache or self.tipo_fonte != 'pdf' or self._conteudo_simulado:
+            return
+        
+        # Sem o número de páginas, a extração de metadados falhou e as
+        # informações têm os valores 'Não disponível': a próxima execução
+        # tenta extraí-las de novo
+        if not isinstance(self.info_fonte.get('total_paginas'), int):
+            logger.info("Informações do PDF incompletas; conteúdo não gravado no cache")
+            return
+        
+        arquivo = _caminho_cache(self.fonte, self._obter_stat_fonte())
+        if arquivo:
+            _gravar_cache(arquivo, {'info_fonte': self.info_fonte, 'conteudo': self.conteudo})
+    
+    def _carregar_palavras_do_cache(self, stop_words: FrozenSet[str]) -> Optional[Tuple[List[str], array]]:
+        """
+        Carrega do cache em disco as palavras já processadas de um PDF, se foram
+        processadas com o idioma atual e as mesmas stop words.
+        
+        Args:
+            stop_words (FrozenSet[str]): Stop words do idioma atual
+            
+        Returns:
+            Optional[Tuple[List[str], array]]: Vocabulário e ids ou None se não
+                houver entrada válida
+        """
+        if not self.usar_cache or self.tipo_fonte != 'pdf' or self._conteudo_simulado:
+            return None
+        
+        arquivo = _caminho_cache(self.fonte, self._obter_stat_fonte(), '.palavras')
+        dados = _ler_cache(arquivo) if arquivo else None
+        if dados is None or dados['idioma'] != self._idioma or dados['stop_words'] != stop_words:
+            return None
+        
+        logger.info(f"Palavras processadas carregadas do cache: {len(dados['ids'])} palavras")
+        return [sys.intern(palavra) for palavra in dados['vocabulario']], dados['ids']
+    
+    def _salvar_palavras_no_cache(self, stop_words: FrozenSet[str], vocabulario: List[str], ids: array) -> None:
+        """
+        Grava no cache em disco as palavras processadas de um PDF, junto com o
+        idioma e as stop words usados.
+        
+        Args:
+            stop_words (FrozenSet[str]): Stop words usadas no processamento
+            vocabulario (List[str]): Vocabulário (id -> palavra)
+            ids (array): Ids das palavras na ordem do texto
+        """
+        if not self.usar_cache or self.tipo_fonte != 'pdf' or self._conteudo_simulado:
+            return
+        
+        arquivo = _caminho_cache(self.fonte, self._obter_stat_fonte(), '.palavras')
+        if arquivo:
+            _gravar_cache(arquivo, {
+                'idioma': self._idioma,
+                'stop_words': stop_words,
+                'vocabulario': vocabulario,
+                'ids': ids,
+            })
+    
     def _extrair_informacoes_fonte(self) -> None:
         """
         Extrai informações gerais da fonte (PDF ou web).
         """
         try:
-            if self.tipo_fonte == 'pdf':
-                self._extrair_informacoes_pdf()
-            elif self.tipo_fonte == 'web':
-                self._extrair_informacoes_web()
-            
+            self._extrair_informacoes_tipo()
             logger.info(f"Informações da fonte extraídas")
             
         except Exception as e:
@@ -153,14 +993,16 @@ class AnalisadorDocumental:
         """
         Extrai informações de um arquivo PDF.
         """
-        # Informações básicas do arquivo (sempre disponíveis)
+        # Informações básicas do arquivo (sempre disponíveis), a partir do
+        # os.stat já feito na validação
+        st = self._obter_stat_fonte()
         self.info_fonte = {
             'tipo': 'PDF',
             'nome': os.path.basename(self.fonte),
             'caminho_completo': self.fonte,
-            'tamanho_bytes': os.path.getsize(self.fonte),
+            'tamanho_bytes': st.st_size,
             'data_modificacao': datetime.fromtimestamp(
-                os.path.getmtime(self.fonte)
+                st.st_mtime
             ).strftime('%d/%m/%Y %H:%M:%S'),
             'total_paginas': 'Não disponível (bibliotecas não instaladas)',
             'versao_pdf': 'Não disponível',
@@ -171,47 +1013,95 @@ class AnalisadorDocumental:
         # Tenta extrair informações usando diferentes bibliotecas
         self._tentar_extrair_metadados()
     
+    def _obter_resposta_web(self):
+        """
+        Baixa a página web uma única vez, compartilhando a resposta entre a
+        extração de informações e a extração de conteúdo. O corpo é lido em
+        streaming e limitado a _MAX_BYTES_PAGINA.
+        
+        Sem requests-cache, a requisição é condicional (If-None-Match /
+        If-Modified-Since) quando há uma cópia anterior da página em disco;
+        se o servidor responder 304, o corpo vem dessa cópia.
+        
+        Returns:
+            Tuple[requests.Response, bytes]: Resposta HTTP (cabeçalhos e status)
+                e corpo da página já descompactado
+            
+        Raises:
+            ImportError: Se requests não estiver instalado
+            requests.RequestException: Em caso de erro na requisição
+        """
+        if self._resposta_web is None:
+            sessao = _obter_sessao()
+            
+            # A CachedSession do requests-cache já revalida suas entradas
+            arquivo_cache = None
+            anterior = None
+            cabecalhos = {}
+            if self.usar_cache and not hasattr(sessao, 'cache'):
+                arquivo_cache = _caminho_cache_web(self.fonte)
+                anterior = _ler_cache(arquivo_cache)
+                if anterior:
+                    if anterior['etag']:
+                        cabecalhos['If-None-Match'] = anterior['etag']
+                    if anterior['last_modified']:
+                        cabecalhos['If-Modified-Since'] = anterior['last_modified']
+            
+            logger.info(f"Fazendo requisição para: {self.fonte}")
+            with sessao.get(self.fonte, timeout=(10, 30), stream=True, headers=cabecalhos) as resposta:
+                if resposta.status_code == 304 and anterior:
+                    logger.info("Página não modificada desde o último acesso; usando cópia em cache")
+                    resposta.status_code = anterior['status_code']
+                    resposta.encoding = anterior['encoding']
+                    resposta.headers['content-type'] = anterior['content_type']
+                    self._resposta_web = (resposta, anterior['corpo'])
+                    return self._resposta_web
+                
+                resposta.raise_for_status()
+                corpo = resposta.raw.read(_MAX_BYTES_PAGINA + 1, decode_content=True)
+            
+            if len(corpo) > _MAX_BYTES_PAGINA:
+                logger.warning(f"Página maior que {_formatar_tamanho(_MAX_BYTES_PAGINA)}; "
+                               f"apenas o início será analisado")
+                corpo = corpo[:_MAX_BYTES_PAGINA]
+            
+            etag = resposta.headers.get('ETag')
+            last_modified = resposta.headers.get('Last-Modified')
+            if arquivo_cache is not None and (etag or last_modified):
+                _gravar_cache(arquivo_cache, {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'status_code': resposta.status_code,
+                    'content_type': resposta.headers.get('content-type', 'Desconhecido'),
+                    'encoding': resposta.encoding,
+                    'corpo': corpo,
+                })
+            self._resposta_web = (resposta, corpo)
+        return self._resposta_web
+    
     def _extrair_informacoes_web(self) -> None:
         """
         Extrai informações de uma página web.
         """
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
-            # Faz requisição para obter informações básicas
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(self.fonte, headers=headers, timeout=10)
-            response.raise_for_status()
+            response, corpo = self._obter_resposta_web()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extrai informações da página
-            titulo = soup.find('title')
-            titulo_texto = titulo.get_text().strip() if titulo else 'Sem título'
-            
-            # Extrai meta tags
-            meta_tags = {}
-            for meta in soup.find_all('meta'):
-                name = meta.get('name') or meta.get('property')
-                content = meta.get('content')
-                if name and content:
-                    meta_tags[name] = content
+            # Extrai título e meta tags da página
+            titulo_texto, meta_tags = _extrair_titulo_e_metadados_html(corpo)
             
             self.info_fonte = {
                 'tipo': 'Página Web',
                 'url': self.fonte,
                 'titulo': titulo_texto,
-                'tamanho_bytes': len(response.content),
+                'tamanho_bytes': len(corpo),
                 'data_acesso': datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
                 'status_code': response.status_code,
                 'content_type': response.headers.get('content-type', 'Desconhecido'),
                 'encoding': response.encoding,
                 'metadados': meta_tags
             }
+            if 'conteudo' in self.__dict__:
+                self._resposta_web = None
             
         except ImportError:
             logger.warning("requests ou beautifulsoup4 não instalados. Usando informações básicas.")
@@ -244,15 +1134,17 @@ class AnalisadorDocumental:
         """
         Tenta extrair metadados usando diferentes bibliotecas disponíveis.
         """
+        if _PDF_BACKEND is None:
+            logger.info("Nenhuma biblioteca de PDF disponível para extrair metadados")
+            return
+        
         # Tenta com PyMuPDF (fitz) primeiro
-        if self._extrair_metadados_pymupdf():
+        if fitz is not None and self._extrair_metadados_pymupdf():
             return
         
         # Tenta com pdfplumber
-        if self._extrair_metadados_pdfplumber():
+        if pdfplumber is not None and self._extrair_metadados_pdfplumber():
             return
-        
-        logger.info("Nenhuma biblioteca de PDF disponível para extrair metadados")
     
     def _extrair_metadados_pymupdf(self) -> bool:
         """
@@ -262,19 +1154,17 @@ class AnalisadorDocumental:
             bool: True se conseguiu extrair, False caso contrário
         """
         try:
-            import fitz  # PyMuPDF
-            
             doc = fitz.open(self.fonte)
+            metadata = doc.metadata or {}
             
-            # Informações básicas
+            # Informações básicas ('format' traz a versão, ex.: "PDF 1.7")
             self.info_fonte.update({
-                'total_paginas': len(doc),
-                'versao_pdf': f"{doc.version}",
-                'criptografado': doc.needs_pass,
+                'total_paginas': doc.page_count,
+                'versao_pdf': metadata.get('format') or 'Não disponível',
+                'criptografado': doc.is_encrypted,
             })
             
             # Metadados
-            metadata = doc.metadata
             if metadata:
                 self.info_fonte['metadados'] = {
                     'titulo': metadata.get('title', 'Não informado'),
@@ -290,9 +1180,6 @@ class AnalisadorDocumental:
             logger.info(f"Metadados PyMuPDF extraídos: {self.info_fonte['total_paginas']} páginas")
             return True
             
-        except ImportError:
-            logger.info("PyMuPDF não está instalado")
-            return False
         except Exception as e:
             logger.warning(f"Erro ao extrair metadados com PyMuPDF: {e}")
             return False
@@ -305,8 +1192,6 @@ class AnalisadorDocumental:
             bool: True se conseguiu extrair, False caso contrário
         """
         try:
-            import pdfplumber
-            
             with pdfplumber.open(self.fonte) as pdf:
                 # Informações básicas
                 self.info_fonte.update({
@@ -331,9 +1216,6 @@ class AnalisadorDocumental:
                 logger.info(f"Metadados pdfplumber extraídos: {self.info_fonte['total_paginas']} páginas")
                 return True
                 
-        except ImportError:
-            logger.info("pdfplumber não está instalado")
-            return False
         except Exception as e:
             logger.warning(f"Erro ao extrair metadados com pdfplumber: {e}")
             return False
@@ -344,11 +1226,7 @@ class AnalisadorDocumental:
         Extrai o conteúdo da fonte (PDF ou web).
         """
         try:
-            if self.tipo_fonte == 'pdf':
-                self._extrair_conteudo_pdf()
-            elif self.tipo_fonte == 'web':
-                self._extrair_conteudo_web()
-            
+            self._extrair_conteudo_tipo()
         except Exception as e:
             logger.error(f"Erro ao extrair conteúdo: {e}")
             self._usar_conteudo_simulado()
@@ -357,16 +1235,18 @@ class AnalisadorDocumental:
         """
         Extrai o conteúdo de um arquivo PDF.
         """
-        # Tenta diferentes métodos de extração em ordem de preferência
-        conteudo = self._extrair_com_pymupdf()
-        if conteudo:
-            self.conteudo = conteudo
-            return
+        # Tenta as bibliotecas disponíveis em ordem de preferência
+        if fitz is not None:
+            conteudo = self._extrair_com_pymupdf()
+            if conteudo:
+                self.conteudo = conteudo
+                return
         
-        conteudo = self._extrair_com_pdfplumber()
-        if conteudo:
-            self.conteudo = conteudo
-            return
+        if pdfplumber is not None:
+            conteudo = self._extrair_com_pdfplumber()
+            if conteudo:
+                self.conteudo = conteudo
+                return
         
         # Fallback: conteúdo simulado para demonstração
         self._usar_conteudo_simulado()
@@ -376,32 +1256,16 @@ class AnalisadorDocumental:
         Extrai o conteúdo de uma página web.
         """
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
-            # Configuração da requisição
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            logger.info(f"Fazendo requisição para: {self.fonte}")
-            response = requests.get(self.fonte, headers=headers, timeout=30)
-            response.raise_for_status()
+            # Reaproveita a resposta já baixada para as informações da página
+            _, corpo = self._obter_resposta_web()
             
-            # Parse do HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse do HTML e extração do texto (sem scripts, estilos e navegação)
+            texto = _extrair_texto_html(corpo)
+            if 'info_fonte' in self.__dict__:
+                self._resposta_web = None
             
-            # Remove scripts e estilos
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-            
-            # Extrai texto
-            texto = soup.get_text()
-            
-            # Limpa o texto
-            linhas = (linha.strip() for linha in texto.splitlines())
-            chunks = (frase.strip() for linha in linhas for frase in linha.split("  "))
-            texto_limpo = ' '.join(chunk for chunk in chunks if chunk)
+            # Limpa o texto em uma única passada
+            texto_limpo = ' '.join(texto.split())
             
             if texto_limpo:
                 self.conteudo = texto_limpo
@@ -417,18 +1281,16 @@ class AnalisadorDocumental:
             logger.error(f"Erro ao extrair conteúdo web: {e}")
             self._usar_conteudo_simulado()
     
-    def _extrair_com_pymupdf(self) -> Optional[str]:
+    def _iterar_paginas_pymupdf(self) -> Iterator[str]:
         """
-        Tenta extrair conteúdo usando PyMuPDF (fitz).
+        Gera o texto de cada página do PDF com PyMuPDF, em ordem, sem manter o
+        documento inteiro em memória.
         
-        Returns:
-            Optional[str]: Conteúdo extraído ou None se falhar
+        Yields:
+            str: Texto da página com espaços normalizados ('' se vazia ou com erro)
         """
+        doc = fitz.open(self.fonte)
         try:
-            import fitz  # PyMuPDF
-            
-            doc = fitz.open(self.fonte)
-            
             # Verifica se o PDF está criptografado
             if doc.needs_pass:
                 logger.warning("PDF está criptografado. Tentando extrair sem senha...")
@@ -436,35 +1298,51 @@ class AnalisadorDocumental:
                     doc.authenticate("")  # Tenta sem senha
                 except:
                     logger.error("PDF criptografado e não foi possível descriptografar")
-                    doc.close()
-                    return None
+                    return
             
-            # Extrai texto de todas as páginas
-            conteudos_paginas = []
             total_paginas = len(doc)
-            
             logger.info(f"Iniciando extração com PyMuPDF: {total_paginas} páginas...")
             
-            for i in range(total_paginas):
-                try:
-                    pagina = doc.load_page(i)
-                    texto_pagina = pagina.get_text()
-                    if texto_pagina:
-                        conteudos_paginas.append(texto_pagina)
-                    
-                    # Log de progresso a cada 10 páginas
-                    if (i + 1) % 10 == 0 or (i + 1) == total_paginas:
-                        logger.info(f"Página {i + 1}/{total_paginas} processada")
-                        
-                except Exception as e:
-                    logger.warning(f"Erro ao extrair página {i + 1}: {e}")
-                    continue
-            
+            num_processos = min(_MAX_PROCESSOS_PDF, os.cpu_count() or 1)
+            if total_paginas < _MIN_PAGINAS_PARALELO or num_processos < 2:
+                yield from _iterar_textos_paginas_pymupdf(doc, 0, total_paginas)
+                return
+        finally:
             doc.close()
-            
-            # Junta todo o conteúdo
-            conteudo = " ".join(conteudos_paginas)
-            conteudo = re.sub(r'\s+', ' ', conteudo).strip()
+        
+        # O MuPDF não é seguro para uso concorrente em threads, então as páginas
+        # são divididas em intervalos contíguos extraídos por processos, cada
+        # um com o seu próprio documento aberto
+        tamanho = -(-total_paginas // num_processos)
+        inicios = range(0, total_paginas, tamanho)
+        fins = [min(inicio + tamanho, total_paginas) for inicio in inicios]
+        paginas_geradas = 0
+        try:
+            with ProcessPoolExecutor(max_workers=num_processos) as executor:
+                for textos in executor.map(_extrair_intervalo_pymupdf, [self.fonte] * len(fins), inicios, fins):
+                    yield from textos
+                    paginas_geradas += len(textos)
+        except BrokenProcessPool as e:
+            # Ex.: script sem "if __name__ == '__main__':" com o método spawn;
+            # as páginas restantes são extraídas neste processo
+            logger.warning(f"Extração paralela interrompida ({e}); continuando em série")
+            doc = fitz.open(self.fonte)
+            try:
+                if doc.needs_pass:
+                    doc.authenticate("")
+                yield from _iterar_textos_paginas_pymupdf(doc, paginas_geradas, total_paginas)
+            finally:
+                doc.close()
+    
+    def _extrair_com_pymupdf(self) -> Optional[str]:
+        """
+        Tenta extrair conteúdo usando PyMuPDF (fitz).
+        
+        Returns:
+            Optional[str]: Conteúdo extraído ou None se falhar
+        """
+        try:
+            conteudo = _juntar_textos_paginas(self._iterar_paginas_pymupdf())
             
             if conteudo:
                 logger.info(f"Conteúdo extraído com PyMuPDF: {len(conteudo)} caracteres")
@@ -473,55 +1351,54 @@ class AnalisadorDocumental:
                 logger.warning("PyMuPDF não conseguiu extrair texto do PDF")
                 return None
                 
-        except ImportError:
-            logger.info("PyMuPDF não está instalado")
-            return None
         except Exception as e:
             logger.error(f"Erro ao extrair com PyMuPDF: {e}")
             return None
     
+    def _iterar_paginas_pdfplumber(self) -> Iterator[str]:
+        """
+        Gera o texto de cada página do PDF com pdfplumber, em ordem.
+        
+        Yields:
+            str: Texto da página com espaços normalizados ('' se vazia ou com erro)
+        """
+        with pdfplumber.open(self.fonte) as pdf:
+            total_paginas = len(pdf.pages)
+            
+            logger.info(f"Iniciando extração com pdfplumber: {total_paginas} páginas...")
+            
+            for i, pagina in enumerate(pdf.pages, 1):
+                try:
+                    yield ' '.join((pagina.extract_text() or '').split())
+                    
+                    # Log de progresso a cada 10 páginas
+                    if i % 10 == 0 or i == total_paginas:
+                        logger.info(f"Página {i}/{total_paginas} processada")
+                        
+                except Exception as e:
+                    logger.warning(f"Erro ao extrair página {i}: {e}")
+                    continue
+                finally:
+                    # Libera o cache de objetos da página já processada
+                    pagina.flush_cache()
+    
     def _extrair_com_pdfplumber(self) -> Optional[str]:
         """
+        Tenta extrair conteúdo usando pdfplumber.
+        
         Returns:
             Optional[str]: Conteúdo extraído ou None se falhar
         """
         try:
-            import pdfplumber
+            conteudo = _juntar_textos_paginas(self._iterar_paginas_pdfplumber())
             
-            with pdfplumber.open(self.fonte) as pdf:
-                conteudos_paginas = []
-                total_paginas = len(pdf.pages)
-                
-                logger.info(f"Iniciando extração com pdfplumber: {total_paginas} páginas...")
-                
-                for i, pagina in enumerate(pdf.pages, 1):
-                    try:
-                        texto_pagina = pagina.extract_text()
-                        if texto_pagina:
-                            conteudos_paginas.append(texto_pagina)
-                        
-                        # Log de progresso a cada 10 páginas
-                        if i % 10 == 0 or i == total_paginas:
-                            logger.info(f"Página {i}/{total_paginas} processada")
-                            
-                    except Exception as e:
-                        logger.warning(f"Erro ao extrair página {i}: {e}")
-                        continue
-                
-                # Junta todo o conteúdo
-                conteudo = " ".join(conteudos_paginas)
-                conteudo = re.sub(r'\s+', ' ', conteudo).strip()
+            if conteudo:
+                logger.info(f"Conteúdo extraído com pdfplumber: {len(conteudo)} caracteres")
+                return conteudo
+            else:
+                logger.warning("pdfplumber não conseguiu extrair texto do PDF")
+                return None
                 
-                if conteudo:
-                    logger.info(f"Conteúdo extraído com pdfplumber: {len(conteudo)} caracteres")
-                    return conteudo
-                else:
-                    logger.warning("pdfplumber não conseguiu extrair texto do PDF")
-                    return None
-                    
-        except ImportError:
-            logger.info("pdfplumber não está instalado")
-            return None
         except Exception as e:
             logger.error(f"Erro ao extrair com pdfplumber: {e}")
             return None
@@ -531,6 +1408,7 @@ class AnalisadorDocumental:
         Usa conteúdo simulado quando não é possível extrair da fonte real.
         """
         logger.warning("Usando conteúdo simulado - bibliotecas não disponíveis")
+        self._conteudo_simulado = True
         
         if self.tipo_fonte == 'pdf':
             self.conteudo = """
@@ -572,27 +1450,85 @@ class AnalisadorDocumental:
     def _processar_palavras(self) -> None:
         """
         Processa e limpa as palavras do conteúdo extraído.
-        Remove pontuação, converte para minúsculas e filtra palavras comuns.
+        Separa as palavras da pontuação, converte para minúsculas e filtra palavras comuns.
         """
-        # Detecta idioma se não foi especificado
-        if not self.idioma_detectado:
-            self.idioma_detectado = self.stop_words_manager.detect_language(self.conteudo)
-            logger.info(f"Idioma detectado: {self.idioma_detectado}")
+        conteudo = self.conteudo
         
-        # Obtém stop words para o idioma detectado
-        stop_words = self.stop_words_manager.get_stop_words(self.idioma_detectado)
+        # Detecta idioma se não foi especificado, usando só uma amostra do início
+        # e do fim do conteúdo
+        if not self._idioma:
+            if len(conteudo) > _AMOSTRA_IDIOMA_INICIO + _AMOSTRA_IDIOMA_FIM:
+                amostra = f"{conteudo[:_AMOSTRA_IDIOMA_INICIO]} {conteudo[-_AMOSTRA_IDIOMA_FIM:]}"
+            else:
+                amostra = conteudo
+            self._idioma = self.stop_words_manager.detect_language(amostra)
+            logger.info(f"Idioma detectado: {self._idioma}")
         
-        # Limpeza e processamento do texto
-        texto_limpo = re.sub(r'[^\w\s]', '', self.conteudo.lower())
-        palavras = texto_limpo.split()
+        # Obtém stop words para o idioma detectado
+        stop_words = self.stop_words_manager.get_stop_words(self._idioma)
+        
+        # Palavras deste PDF já processadas com o mesmo idioma e as mesmas stop
+        # words vêm do cache em disco
+        palavras = self._carregar_palavras_do_cache(stop_words)
+        if palavras is None:
+            palavras = _tokenizar_em_ids(conteudo, stop_words)
+            self._salvar_palavras_no_cache(stop_words, *palavras)
+        self._vocabulario, ids = palavras
+        self._ids = ids
+        self._contagens = None
+        self._ranking = []
+        self._estatisticas = None
+        self._palavras_processadas = None
+        
+        logger.info(f"Processadas {len(ids)} palavras úteis (idioma: {self._idioma})")
+    
+    @property
+    def palavras_processadas(self) -> List[str]:
+        """
+        Lista de palavras após limpeza, na ordem do texto. É reconstruída a
+        partir do vocabulário e dos ids só no primeiro acesso após cada
+        processamento; os acessos seguintes devolvem a mesma lista.
+        """
+        if self._palavras_processadas is None:
+            vocabulario = self._vocabulario
+            self._palavras_processadas = [vocabulario[i] for i in self._ids]
+        return self._palavras_processadas
+    
+    @palavras_processadas.setter
+    def palavras_processadas(self, palavras: Iterable[str]) -> None:
+        palavras = list(palavras)
+        ids_por_palavra: Dict[str, int] = {}
+        self._ids = array('i', [ids_por_palavra.setdefault(palavra, len(ids_por_palavra)) for palavra in palavras])
+        self._vocabulario = list(ids_por_palavra)
+        self._contagens = None
+        self._ranking = []
+        self._estatisticas = None
+        self._palavras_processadas = palavras
+    
+    def _obter_contagens(self):
+        """
+        Retorna a frequência de cada palavra do vocabulário (indexada pelo id),
+        contada uma única vez e reaproveitada pelas chamadas seguintes.
         
-        # Filtra palavras comuns e palavras muito curtas
-        self.palavras_processadas = [
-            palavra for palavra in palavras 
-            if palavra not in stop_words and len(palavra) > 2
-        ]
+        Returns:
+            numpy.ndarray | List[int]: Contagem de ocorrências por id de palavra
+        """
+        if self._contagens is None:
+            self._contagens = _contar_ids(self._ids, len(self._vocabulario))
+        return self._contagens
+    
+    def _ids_mais_frequentes(self, top_n: int) -> List[int]:
+        """
+        Seleciona os ids das top_n palavras mais frequentes. Empates são
+        desfeitos pela ordem de primeira ocorrência, como em Counter.most_common.
         
-        logger.info(f"Processadas {len(self.palavras_processadas)} palavras úteis (idioma: {self.idioma_detectado})")
+        Args:
+            top_n (int): Número de palavras a selecionar
+            
+        Returns:
+            List[int]: Ids ordenados por frequência decrescente
+        """
+        return _ids_mais_frequentes(self._obter_contagens(), top_n)
     
     def analisar_frequencia_palavras(self, top_n: int = 20) -> List[Tuple[str, int]]:
         """
@@ -607,18 +1543,33 @@ class AnalisadorDocumental:
         Raises:
             ValueError: Se não houver palavras processadas
         """
-        if not self.palavras_processadas:
+        if not self._ids:
             raise ValueError("Nenhuma palavra processada disponível para análise")
         
-        # Conta a frequência das palavras
-        contador = Counter(self.palavras_processadas)
-        
-        # Retorna as top_n palavras mais frequentes
-        ranking = contador.most_common(top_n)
+        # Retorna as top_n palavras mais frequentes. O maior ranking já calculado
+        # fica guardado: como a ordem é determinística, rankings menores são
+        # prefixos dele
+        if top_n > len(self._ranking) and len(self._ranking) < len(self._vocabulario):
+            contagens = self._obter_contagens()
+            vocabulario = self._vocabulario
+            self._ranking = [(vocabulario[i], int(contagens[i])) for i in self._ids_mais_frequentes(top_n)]
+        ranking = self._ranking[:max(top_n, 0)]
         
         logger.info(f"Análise de frequência concluída. Top {top_n} palavras identificadas")
         return ranking
     
+    def obter_frequencias(self, palavras: Iterable[str]) -> List[int]:
+        """
+        Retorna a frequência de cada palavra no documento, mesmo fora do ranking.
+        
+        Args:
+            palavras (Iterable[str]): Palavras a consultar
+            
+        Returns:
+            List[int]: Frequência de cada palavra (0 se ausente), na ordem pedida
+        """
+        return _frequencias_de_palavras(self._vocabulario, self._obter_contagens(), palavras)
+    
     def obter_estatisticas_gerais(self) -> Dict[str, any]:
         """
         Retorna estatísticas gerais sobre o documento.
@@ -626,8 +1577,13 @@ class AnalisadorDocumental:
         Returns:
             Dict[str, any]: Dicionário com estatísticas do documento
         """
-        total_palavras = len(self.palavras_processadas)
-        palavras_unicas = len(set(self.palavras_processadas))
+        # Calculadas uma única vez por processamento; devolve uma cópia para que
+        # o chamador possa alterá-la sem afetar o cache
+        if self._estatisticas is not None:
+            return dict(self._estatisticas)
+        
+        total_palavras = len(self._ids)
+        palavras_unicas = len(self._vocabulario)
         
         # Calcula densidade de palavras únicas
         densidade = (palavras_unicas / total_palavras * 100) if total_palavras > 0 else 0
@@ -641,9 +1597,10 @@ class AnalisadorDocumental:
             'tipo_fonte': self.tipo_fonte,
             'idioma_detectado': self.idioma_detectado
         }
+        self._estatisticas = estatisticas
         
         logger.info("Estatísticas gerais calculadas")
-        return estatisticas
+        return dict(estatisticas)
     
 
     
@@ -657,80 +1614,152 @@ class AnalisadorDocumental:
         Returns:
             str: Relatório formatado com todas as análises
         """
-        relatorio = []
-        relatorio.append("=" * 80)
-        relatorio.append("RELATÓRIO DE ANÁLISE DOCUMENTAL")
-        relatorio.append("=" * 80)
-        
-        # Informações da fonte
+        # Informações da fonte, no formato do tipo de fonte
         info = self.obter_informacoes_fonte()
-        relatorio.append("INFORMAÇÕES DA FONTE:")
+        secao_info = self._renderizar_info(info)
         
-        if self.tipo_fonte == 'pdf':
-            relatorio.append(f"- Tipo: {info['tipo']}")
-            relatorio.append(f"- Nome: {info['nome']}")
-            relatorio.append(f"- Caminho: {info['caminho_completo']}")
-            relatorio.append(f"- Tamanho: {self._formatar_tamanho(info['tamanho_bytes'])}")
-            relatorio.append(f"- Data de modificação: {info['data_modificacao']}")
-            relatorio.append(f"- Total de páginas: {info['total_paginas']}")
-            relatorio.append(f"- Versão PDF: {info['versao_pdf']}")
-            relatorio.append(f"- Criptografado: {'Sim' if info['criptografado'] else 'Não'}")
-        else:
-            relatorio.append(f"- Tipo: {info['tipo']}")
-            relatorio.append(f"- URL: {info['url']}")
-            relatorio.append(f"- Título: {info['titulo']}")
-            relatorio.append(f"- Tamanho: {self._formatar_tamanho(info['tamanho_bytes'])}")
-            relatorio.append(f"- Data de acesso: {info['data_acesso']}")
-            relatorio.append(f"- Status: {info['status_code']}")
-            relatorio.append(f"- Content-Type: {info['content_type']}")
-            relatorio.append(f"- Encoding: {info['encoding']}")
-        
-        # Metadados se disponíveis
+        # Metadados se disponíveis (cada linha já com a quebra de linha anterior)
+        secao_metadados = ''
         if info['metadados']:
-            relatorio.append("")
-            relatorio.append("METADADOS:")
-            for chave, valor in info['metadados'].items():
-                if valor and valor != 'Não informado':
-                    relatorio.append(f"- {chave.replace('_', ' ').title()}: {valor}")
-        
-        relatorio.append("")
+            secao_metadados = '\n\nMETADADOS:' + ''.join(
+                f"\n- {chave.replace('_', ' ').title()}: {valor}"
+                for chave, valor in info['metadados'].items()
+                if valor and valor != 'Não informado'
+            )
         
-        # Estatísticas gerais
+        # Estatísticas gerais e ranking de palavras mais frequentes
         stats = self.obter_estatisticas_gerais()
-        relatorio.append("ESTATÍSTICAS GERAIS:")
-        relatorio.append(f"- Total de palavras: {stats['total_palavras']:,}")
-        relatorio.append(f"- Palavras únicas: {stats['palavras_unicas']:,}")
-        relatorio.append(f"- Densidade de vocabulário: {stats['densidade_vocabulario']}%")
-        relatorio.append(f"- Tamanho do conteúdo: {stats['tamanho_conteudo']:,} caracteres")
-        relatorio.append(f"- Idioma detectado: {stats['idioma_detectado']}")
-        relatorio.append("")
-        
-        # Ranking de palavras mais frequentes
-        relatorio.append(f"TOP {top_n} PALAVRAS MAIS FREQUENTES:")
         ranking = self.analisar_frequencia_palavras(top_n)
-        for i, (palavra, frequencia) in enumerate(ranking, 1):
-            relatorio.append(f"{i:2d}. {palavra:<25} - {frequencia:5d} ocorrências")
+        secao_ranking = ''.join(
+            f"\n{i:2d}. {palavra:<25} - {frequencia:5d} ocorrências"
+            for i, (palavra, frequencia) in enumerate(ranking, 1)
+        )
         
-        relatorio.append("")
-        relatorio.append("=" * 80)
+        return _MODELO_RELATORIO.format(
+            separador=_SEPARADOR_RELATORIO,
+            info=secao_info,
+            metadados=secao_metadados,
+            ranking=secao_ranking,
+            top_n=top_n,
+            **stats,
+        )
+
+
+class ResumoDocumento:
+    """
+    Resultado da análise de um PDF (em geral feita em um processo separado):
+    informações da fonte, estatísticas e contagens de palavras, sem o conteúdo
+    extraído.
+    Oferece os métodos de consulta de AnalisadorDocumental usados por
+    AnalisadorMultiplosDocumentos.
+    
+    Atributos:
+        fonte (str): Caminho do arquivo PDF
+        info_fonte (Dict): Informações gerais da fonte
+        estatisticas (Dict): Estatísticas gerais do documento
+        vocabulario (List[str]): Palavras processadas distintas (id -> palavra)
+        contagens (numpy.ndarray | List[int]): Ocorrências de cada palavra, por id
+    """
+    
+    # Um resumo é mantido por documento durante toda a análise: sem __dict__
+    # por instância, cada um ocupa menos memória
+    __slots__ = ('fonte', 'info_fonte', 'estatisticas', 'vocabulario', 'contagens', '_ranking')
+    
+    def __init__(self, fonte: str, info_fonte: Dict[str, any], estatisticas: Dict[str, any],
+                 vocabulario: List[str], contagens):
+        self.fonte = fonte
+        self.info_fonte = info_fonte
+        self.estatisticas = estatisticas
+        self.vocabulario = vocabulario
+        self.contagens = contagens
+        # Maior ranking já calculado; rankings menores são prefixos dele
+        self._ranking: List[Tuple[str, int]] = []
+    
+    def obter_informacoes_fonte(self) -> Dict[str, any]:
+        """
+        Retorna informações detalhadas sobre a fonte.
+        
+        Returns:
+            Dict[str, any]: Dicionário com informações da fonte
+        """
+        return self.info_fonte
+    
+    def obter_estatisticas_gerais(self) -> Dict[str, any]:
+        """
+        Retorna estatísticas gerais sobre o documento.
+        
+        Returns:
+            Dict[str, any]: Dicionário com estatísticas do documento
+        """
+        return dict(self.estatisticas)
+    
+    def analisar_frequencia_palavras(self, top_n: int = 20) -> List[Tuple[str, int]]:
+        """
+        Retorna o ranking das palavras mais frequentes do documento.
+        
+        Args:
+            top_n (int): Número de palavras mais frequentes a retornar
+            
+        Returns:
+            List[Tuple[str, int]]: Lista de tuplas (palavra, frequência) ordenada por frequência
+            
+        Raises:
+            ValueError: Se não houver palavras processadas
+        """
+        if not self.vocabulario:
+            raise ValueError("Nenhuma palavra processada disponível para análise")
         
-        return "\n".join(relatorio)
+        # O relatório, a consolidação e o Excel pedem rankings de tamanhos
+        # diferentes do mesmo documento: a seleção só é refeita quando um
+        # ranking maior que o guardado é pedido
+        if top_n > len(self._ranking) and len(self._ranking) < len(self.vocabulario):
+            vocabulario = self.vocabulario
+            contagens = self.contagens
+            self._ranking = [(vocabulario[i], int(contagens[i])) for i in _ids_mais_frequentes(contagens, top_n)]
+        return self._ranking[:max(top_n, 0)]
     
-    def _formatar_tamanho(self, bytes_size: int) -> str:
+    def obter_frequencias(self, palavras: Iterable[str]) -> List[int]:
         """
-        Formata o tamanho em bytes para uma representação legível.
+        Retorna a frequência de cada palavra no documento, mesmo fora do ranking.
         
         Args:
-            bytes_size (int): Tamanho em bytes
+            palavras (Iterable[str]): Palavras a consultar
             
         Returns:
-            str: Tamanho formatado (ex: "1.5 MB")
+            List[int]: Frequência de cada palavra (0 se ausente), na ordem pedida
         """
-        for unidade in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unidade}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} TB"
+        return _frequencias_de_palavras(self.vocabulario, self.contagens, palavras)
+
+
+def _inicializar_processo_documentos() -> None:
+    """
+    Inicializa um processo de análise de documentos: cada processo já cuida
+    de um PDF inteiro, então a extração de páginas dentro dele é serial.
+    """
+    global _MAX_PROCESSOS_PDF
+    _MAX_PROCESSOS_PDF = 1
+
+
+def _analisar_um_pdf(caminho: str, idioma: Optional[str]) -> ResumoDocumento:
+    """
+    Analisa um PDF e resume o resultado, descartando o analisador e o conteúdo
+    extraído; executada nos processos de AnalisadorMultiplosDocumentos.
+    
+    Args:
+        caminho (str): Caminho do arquivo PDF
+        idioma (str, optional): Idioma para stop words
+        
+    Returns:
+        ResumoDocumento: Informações, estatísticas e contagens de palavras do PDF
+    """
+    analisador = AnalisadorDocumental(caminho, idioma=idioma)
+    return ResumoDocumento(
+        caminho,
+        analisador.obter_informacoes_fonte(),
+        analisador.obter_estatisticas_gerais(),
+        analisador._vocabulario,
+        analisador._obter_contagens(),
+    )
 
 
 class AnalisadorMultiplosDocumentos:
@@ -740,7 +1769,7 @@ class AnalisadorMultiplosDocumentos:
     
     Atributos:
         pasta (str): Caminho para a pasta contendo os PDFs
-        analisadores (List[AnalisadorDocumental]): Lista de analisadores para cada documento
+        analisadores (List[ResumoDocumento]): Resultado da análise de cada documento
         resultados_gerais (Dict): Resultados consolidados de todos os documentos
     """
     
@@ -791,13 +1820,12 @@ class AnalisadorMultiplosDocumentos:
         Returns:
             List[str]: Lista de caminhos completos para os PDFs encontrados
         """
-        pdfs = []
-        
         try:
-            for arquivo in os.listdir(self.pasta):
-                if arquivo.lower().endswith('.pdf'):
-                    caminho_completo = os.path.join(self.pasta, arquivo)
-                    pdfs.append(caminho_completo)
+            # scandir traz o tipo de cada entrada junto com o nome, sem um stat
+            # por arquivo; subpastas terminadas em .pdf são ignoradas
+            with os.scandir(self.pasta) as entradas:
+                pdfs = [entrada.path for entrada in entradas
+                        if entrada.name.endswith(_EXTENSOES_PDF) and entrada.is_file()]
             
             logger.info(f"Encontrados {len(pdfs)} arquivos PDF na pasta")
             return pdfs
@@ -808,7 +1836,8 @@ class AnalisadorMultiplosDocumentos:
     
     def _encontrar_e_analisar_pdfs(self) -> None:
         """
-        Encontra todos os PDFs na pasta e cria analisadores para cada um.
+        Encontra todos os PDFs na pasta e analisa cada um, em paralelo quando há
+        mais de um processador, guardando só o resumo de cada documento.
         """
         pdfs = self._encontrar_pdfs()
         
@@ -818,15 +1847,32 @@ class AnalisadorMultiplosDocumentos:
         
         logger.info(f"Iniciando análise de {len(pdfs)} documentos...")
         
-        for i, pdf in enumerate(pdfs, 1):
-            try:
-                logger.info(f"Analisando documento {i}/{len(pdfs)}: {os.path.basename(pdf)}")
-                analisador = AnalisadorDocumental(pdf, self.api_key, self.idioma)
-                self.analisadores.append(analisador)
-                
-            except Exception as e:
-                logger.error(f"Erro ao analisar {pdf}: {e}")
-                continue
+        # Cada PDF vira um ResumoDocumento e o conteúdo extraído é descartado
+        # logo após a análise
+        num_processos = min(_MAX_PROCESSOS_PDF, os.cpu_count() or 1, len(pdfs))
+        if num_processos < 2:
+            for i, pdf in enumerate(pdfs, 1):
+                try:
+                    logger.info(f"Analisando documento {i}/{len(pdfs)}: {os.path.basename(pdf)}")
+                    self.analisadores.append(_analisar_um_pdf(pdf, self.idioma))
+                    
+                except Exception as e:
+                    logger.error(f"Erro ao analisar {pdf}: {e}")
+                    continue
+        else:
+            # Cada PDF é analisado por inteiro em um processo, que devolve só o
+            # resumo, na ordem original dos arquivos
+            with ProcessPoolExecutor(max_workers=num_processos,
+                                     initializer=_inicializar_processo_documentos) as executor:
+                futuros = [executor.submit(_analisar_um_pdf, pdf, self.idioma) for pdf in pdfs]
+                for i, (pdf, futuro) in enumerate(zip(pdfs, futuros), 1):
+                    try:
+                        self.analisadores.append(futuro.result())
+                        logger.info(f"Documento {i}/{len(pdfs)} analisado: {os.path.basename(pdf)}")
+                        
+                    except Exception as e:
+                        logger.error(f"Erro ao analisar {pdf}: {e}")
+                        continue
         
         logger.info(f"Análise concluída: {len(self.analisadores)} documentos processados com sucesso")
     
@@ -893,7 +1939,7 @@ class AnalisadorMultiplosDocumentos:
             'total_palavras_unicas': total_palavras_unicas_geral,
             'densidade_vocabulario_geral': round(densidade_geral, 2),
             'tamanho_conteudo_total': total_tamanho_conteudo,
-            'ranking_consolidado': ranking_consolidado.most_common(50),
+            'ranking_consolidado': ranking_consolidado.most_common(),
             'documentos': documentos_info,
             'pasta_analisada': self.pasta,
             'data_analise': datetime.now().strftime('%d/%m/%Y %H:%M:%S')
@@ -983,108 +2029,96 @@ class AnalisadorMultiplosDocumentos:
         """
         return self.obter_ranking_individual(indice_documento, top_n)
     
-    def gerar_relatorio_completo(self, top_n: int = 25) -> str:
+    def _iterar_linhas_relatorio(self, top_n: int) -> Iterator[str]:
         """
-        Gera um relatório completo com análise de todos os documentos.
+        Gera as linhas do relatório completo, uma seção por vez, sem montar
+        uma lista com o relatório inteiro.
         
         Args:
             top_n (int): Número de palavras mais frequentes para incluir no ranking geral
             
-        Returns:
-            str: Relatório formatado com todas as análises
+        Yields:
+            str: Linhas do relatório (blocos de detalhes podem ocupar várias linhas)
         """
-        if not self.resultados_gerais:
-            return "Nenhum documento foi analisado com sucesso."
-        
-        relatorio = []
-        relatorio.append("=" * 100)
-        relatorio.append("RELATÓRIO DE ANÁLISE DOCUMENTAL - MÚLTIPLOS DOCUMENTOS")
-        relatorio.append("=" * 100)
+        yield "=" * 100
+        yield "RELATÓRIO DE ANÁLISE DOCUMENTAL - MÚLTIPLOS DOCUMENTOS"
+        yield "=" * 100
         
         # Informações gerais
-        stats = self.obter_estatisticas_gerais()
-        relatorio.append("INFORMAÇÕES GERAIS:")
-        relatorio.append(f"- Pasta analisada: {stats['pasta_analisada']}")
-        relatorio.append(f"- Data da análise: {stats['data_analise']}")
-        relatorio.append(f"- Total de documentos: {stats['total_documentos']}")
-        relatorio.append(f"- Total de palavras: {stats['total_palavras']:,}")
-        relatorio.append(f"- Total de palavras únicas: {stats['total_palavras_unicas']:,}")
-        relatorio.append(f"- Densidade de vocabulário geral: {stats['densidade_vocabulario_geral']}%")
-        relatorio.append(f"- Tamanho total do conteúdo: {stats['tamanho_conteudo_total']:,} caracteres")
-        relatorio.append("")
+        yield _MODELO_INFO_MULTIPLOS.format_map(self.obter_estatisticas_gerais())
+        yield ""
         
         # Ranking geral consolidado
-        relatorio.append(f"RANKING GERAL - TOP {top_n} PALAVRAS MAIS FREQUENTES:")
-        ranking_geral = self.obter_ranking_geral(top_n)
-        for i, (palavra, frequencia) in enumerate(ranking_geral, 1):
-            relatorio.append(f"{i:2d}. {palavra:<25} - {frequencia:5d} ocorrências")
+        yield f"RANKING GERAL - TOP {top_n} PALAVRAS MAIS FREQUENTES:"
+        for i, (palavra, frequencia) in enumerate(self.obter_ranking_geral(top_n), 1):
+            yield f"{i:2d}. {palavra:<25} - {frequencia:5d} ocorrências"
         
-        relatorio.append("")
+        yield ""
         
         # Detalhes de cada documento
-        relatorio.append("DETALHES DOS DOCUMENTOS ANALISADOS:")
-        relatorio.append("-" * 100)
+        yield "DETALHES DOS DOCUMENTOS ANALISADOS:"
+        yield "-" * 100
         
         documentos = self.obter_documentos_analisados()
         for i, doc in enumerate(documentos, 1):
-            relatorio.append(f"")
-            relatorio.append(f"DOCUMENTO {i}: {doc['nome']}")
-            relatorio.append(f"  - Caminho: {doc['caminho']}")
-            relatorio.append(f"  - Total de palavras: {doc['total_palavras']:,}")
-            relatorio.append(f"  - Palavras únicas: {doc['palavras_unicas']:,}")
-            relatorio.append(f"  - Densidade de vocabulário: {doc['densidade_vocabulario']}%")
-            relatorio.append(f"  - Tamanho do conteúdo: {doc['tamanho_conteudo']:,} caracteres")
-            relatorio.append(f"  - Idioma: {doc['idioma']}")
-            relatorio.append(f"  - Total de páginas: {doc['total_paginas']}")
-            relatorio.append(f"  - Tamanho do arquivo: {self._formatar_tamanho(doc['tamanho_arquivo'])}")
+            yield _MODELO_DETALHES_DOCUMENTO.format_map({
+                **doc,
+                'indice': i,
+                'tamanho_arquivo': _formatar_tamanho(doc['tamanho_arquivo']),
+            })
             
             # Ranking individual do documento
-            relatorio.append(f"")
-            relatorio.append(f"  TOP 20 PALAVRAS MAIS FREQUENTES (DOCUMENTO {i}):")
             ranking_individual = self._obter_ranking_individual(i-1, 20)  # i-1 porque é índice baseado em 0
             if ranking_individual:
                 for j, (palavra, frequencia) in enumerate(ranking_individual, 1):
-                    relatorio.append(f"    {j:2d}. {palavra:<20} - {frequencia:4d} ocorrências")
+                    yield f"    {j:2d}. {palavra:<20} - {frequencia:4d} ocorrências"
             else:
-                relatorio.append(f"    Nenhuma palavra encontrada para este documento.")
+                yield "    Nenhuma palavra encontrada para este documento."
         
-        relatorio.append("")
-        relatorio.append("=" * 100)
-        
-        return "\n".join(relatorio)
+        yield ""
+        yield "=" * 100
     
-    def _formatar_tamanho(self, bytes_size: int) -> str:
+    def gerar_relatorio_completo(self, top_n: int = 25) -> str:
         """
-        Formata o tamanho em bytes para uma representação legível.
+        Gera um relatório completo com análise de todos os documentos.
         
         Args:
-            bytes_size (int): Tamanho em bytes
+            top_n (int): Número de palavras mais frequentes para incluir no ranking geral
             
         Returns:
-            str: Tamanho formatado (ex: "1.5 MB")
+            str: Relatório formatado com todas as análises
+        """
+        if not self.resultados_gerais:
+            return "Nenhum documento foi analisado com sucesso."
+        
+        return "\n".join(self._iterar_linhas_relatorio(top_n))
+    
+    def escrever_relatorio(self, arquivo: TextIO, top_n: int = 25) -> None:
+        """
+        Escreve o relatório completo em um arquivo (ou sys.stdout) à medida que
+        as linhas são geradas, sem montar o relatório inteiro em memória.
+        
+        Args:
+            arquivo (TextIO): Arquivo de texto aberto para escrita
+            top_n (int): Número de palavras mais frequentes para incluir no ranking geral
         """
-        for unidade in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unidade}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} TB"
+        if not self.resultados_gerais:
+            arquivo.write("Nenhum documento foi analisado com sucesso.\n")
+            return
+        
+        for linha in self._iterar_linhas_relatorio(top_n):
+            arquivo.write(linha)
+            arquivo.write("\n")
     
     def verificar_openpyxl_disponivel(self) -> bool:
         """
-        Verifica se o openpyxl está disponível e funcionando.
+        Verifica se o openpyxl está disponível (a importação é feita uma única vez,
+        na carga do módulo).
         
         Returns:
             bool: True se openpyxl está disponível, False caso contrário
         """
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            return True
-        except ImportError:
-            return False
-        except Exception:
-            return False
+        return openpyxl is not None
     
     def exportar_relatorio_excel(self, caminho_arquivo: str, top_n_palavras: int = 50) -> bool:
         """
@@ -1110,21 +2144,15 @@ class AnalisadorMultiplosDocumentos:
                 "Ou tente reinstalar: pip uninstall openpyxl && pip install openpyxl"
             )
         
-        # Importa openpyxl (já verificado que está disponível)
-        import openpyxl
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
-        logger.info("openpyxl importado com sucesso")
-        
         if not self.resultados_gerais or not self.analisadores:
             raise ValueError("Nenhum documento foi analisado. Execute a análise primeiro.")
         
         logger.info(f"Iniciando exportação para Excel: {caminho_arquivo}")
         
-        # Cria um novo workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Análise Documental"
+        # Workbook em modo write_only: as linhas são gravadas em sequência no
+        # arquivo, sem manter um objeto de célula por valor em memória
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Análise Documental")
         
         # Estilos para formatação
         header_font = Font(bold=True, color="FFFFFF")
@@ -1137,24 +2165,30 @@ class AnalisadorMultiplosDocumentos:
         )
         center_alignment = Alignment(horizontal="center", vertical="center")
         
-        # Obtém todas as palavras únicas mais frequentes de todos os documentos
-        todas_palavras = set()
-        for analisador in self.analisadores:
-            ranking = analisador.analisar_frequencia_palavras(top_n_palavras)
-            for palavra, _ in ranking:
-                todas_palavras.add(palavra)
-        
-        # Ordena as palavras por frequência geral
-        palavras_ordenadas = []
-        ranking_geral = self.obter_ranking_geral(len(todas_palavras))
-        palavras_gerais = {palavra: freq for palavra, freq in ranking_geral}
-        
-        for palavra in todas_palavras:
-            frequencia = palavras_gerais.get(palavra, 0)
-            palavras_ordenadas.append((palavra, frequencia))
-        
-        palavras_ordenadas.sort(key=lambda x: x[1], reverse=True)
-        colunas_palavras = [palavra for palavra, _ in palavras_ordenadas[:top_n_palavras]]
+        # Estilos nomeados registrados uma única vez no workbook: cada célula só
+        # referencia o estilo pelo nome, sem copiar fonte, borda e alinhamento
+        wb.add_named_style(NamedStyle(name='cabecalho', font=header_font, fill=header_fill,
+                                      border=border, alignment=center_alignment))
+        wb.add_named_style(NamedStyle(name='cabecalho_resumo', font=header_font, fill=header_fill,
+                                      border=border))
+        wb.add_named_style(NamedStyle(name='corpo', border=border))
+        wb.add_named_style(NamedStyle(name='corpo_centralizado', border=border, alignment=center_alignment))
+        
+        def celula(planilha, valor, estilo: str = 'corpo') -> WriteOnlyCell:
+            """Cria uma célula com um dos estilos nomeados do workbook."""
+            cell = WriteOnlyCell(planilha, value=valor)
+            cell.style = estilo
+            return cell
+        
+        # As colunas são as palavras mais frequentes no ranking geral, que já
+        # está ordenado por frequência
+        colunas_palavras = [palavra for palavra, _ in self.obter_ranking_geral(top_n_palavras)]
+        
+        # Frequência de cada coluna em cada documento, tirada das contagens
+        # completas: uma palavra do ranking geral pode estar fora do ranking
+        # individual de todos os documentos
+        frequencias_documentos = [analisador.obter_frequencias(colunas_palavras)
+                                  for analisador in self.analisadores]
         
         # Cabeçalhos das colunas
         colunas = [
@@ -1162,41 +2196,7 @@ class AnalisadorMultiplosDocumentos:
             "Tamanho Conteúdo", "Idioma", "Total Páginas", "Tamanho Arquivo"
         ] + colunas_palavras
         
-        # Aplica cabeçalhos
-        for col, header in enumerate(colunas, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_alignment
-            cell.border = border
-        
-        # Preenche os dados de cada documento
-        documentos = self.obter_documentos_analisados()
-        
-        for row, doc in enumerate(documentos, 2):
-            # Informações básicas do documento
-            ws.cell(row=row, column=1, value=doc['nome']).border = border
-            ws.cell(row=row, column=2, value=doc['total_palavras']).border = border
-            ws.cell(row=row, column=3, value=doc['palavras_unicas']).border = border
-            ws.cell(row=row, column=4, value=f"{doc['densidade_vocabulario']}%").border = border
-            ws.cell(row=row, column=5, value=doc['tamanho_conteudo']).border = border
-            ws.cell(row=row, column=6, value=doc['idioma']).border = border
-            ws.cell(row=row, column=7, value=str(doc['total_paginas'])).border = border
-            ws.cell(row=row, column=8, value=self._formatar_tamanho(doc['tamanho_arquivo'])).border = border
-            
-            # Obtém ranking individual do documento
-            indice_doc = row - 2  # Índice baseado em 0
-            ranking_individual = self.obter_ranking_individual(indice_doc, top_n_palavras)
-            palavras_doc = {palavra: freq for palavra, freq in ranking_individual}
-            
-            # Preenche frequências das palavras
-            for col, palavra in enumerate(colunas_palavras, 9):
-                frequencia = palavras_doc.get(palavra, 0)
-                cell = ws.cell(row=row, column=col, value=frequencia)
-                cell.border = border
-                cell.alignment = center_alignment
-        
-        # Ajusta largura das colunas
+        # Ajusta largura das colunas (no modo write_only, antes de gravar as linhas)
         for col in range(1, len(colunas) + 1):
             column_letter = get_column_letter(col)
             if col == 1:  # Coluna do nome do documento
@@ -1206,16 +2206,43 @@ class AnalisadorMultiplosDocumentos:
             else:  # Colunas de palavras
                 ws.column_dimensions[column_letter].width = 12
         
+        # Aplica cabeçalhos
+        ws.append([celula(ws, header, 'cabecalho') for header in colunas])
+        
+        # Preenche os dados de cada documento
+        documentos = self.obter_documentos_analisados()
+        
+        for indice_doc, doc in enumerate(documentos):
+            # Informações básicas do documento
+            linha = [
+                celula(ws, doc['nome']),
+                celula(ws, doc['total_palavras']),
+                celula(ws, doc['palavras_unicas']),
+                celula(ws, f"{doc['densidade_vocabulario']}%"),
+                celula(ws, doc['tamanho_conteudo']),
+                celula(ws, doc['idioma']),
+                celula(ws, str(doc['total_paginas'])),
+                celula(ws, _formatar_tamanho(doc['tamanho_arquivo'])),
+            ]
+            
+            # Preenche frequências das palavras
+            frequencias = (frequencias_documentos[indice_doc] if indice_doc < len(frequencias_documentos)
+                           else [0] * len(colunas_palavras))
+            linha.extend(celula(ws, frequencia, 'corpo_centralizado') for frequencia in frequencias)
+            ws.append(linha)
+        
         # Adiciona uma segunda aba com resumo geral
         ws_resumo = wb.create_sheet("Resumo Geral")
         
+        # Ajusta largura das colunas do resumo
+        ws_resumo.column_dimensions['A'].width = 30
+        ws_resumo.column_dimensions['B'].width = 50
+        
         # Cabeçalho do resumo
-        ws_resumo.cell(row=1, column=1, value="Métrica").font = header_font
-        ws_resumo.cell(row=1, column=2, value="Valor").font = header_font
-        ws_resumo.cell(row=1, column=1).fill = header_fill
-        ws_resumo.cell(row=1, column=2).fill = header_fill
-        ws_resumo.cell(row=1, column=1).border = border
-        ws_resumo.cell(row=1, column=2).border = border
+        ws_resumo.append([
+            celula(ws_resumo, "Métrica", 'cabecalho_resumo'),
+            celula(ws_resumo, "Valor", 'cabecalho_resumo'),
+        ])
         
         # Dados do resumo
         stats = self.obter_estatisticas_gerais()
@@ -1229,13 +2256,8 @@ class AnalisadorMultiplosDocumentos:
             ("Data da Análise", stats['data_analise'])
         ]
         
-        for row, (metrica, valor) in enumerate(resumo_dados, 2):
-            ws_resumo.cell(row=row, column=1, value=metrica).border = border
-            ws_resumo.cell(row=row, column=2, value=valor).border = border
-        
-        # Ajusta largura das colunas do resumo
-        ws_resumo.column_dimensions['A'].width = 30
-        ws_resumo.column_dimensions['B'].width = 50
+        for metrica, valor in resumo_dados:
+            ws_resumo.append([celula(ws_resumo, metrica), celula(ws_resumo, valor)])
         
         # Salva o arquivo
         wb.save(caminho_arquivo)
@@ -1264,7 +2286,7 @@ def main():
         print("--- ANÁLISE DE MÚLTIPLOS PDFs ---")
         pasta_pdfs = "C:/Users/matol/Documents/anpocs2025/corpusdocumental"  # Substitua pelo caminho da sua pasta
         analisador_multiplos = AnalisadorMultiplosDocumentos(pasta_pdfs)
-        print(analisador_multiplos.gerar_relatorio_completo())
+        analisador_multiplos.escrever_relatorio(sys.stdout)
         
         # Exemplo 3: Exportação para Excel
         print("\n--- EXPORTAÇÃO PARA EXCEL ---")